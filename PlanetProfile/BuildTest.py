@@ -8,13 +8,17 @@
 
 import logging
 import numpy as np
-import importlib, os, fnmatch, sys, time
+import importlib, os, fnmatch, sys, time, tempfile
 from copy import deepcopy
 from PlanetProfile import _Test, _TestImport
 from PlanetProfile.GetConfig import Params as configParams
 from PlanetProfile.Main import PlanetProfile, InductOgram, ReloadInductOgram, ExploreOgram, ReloadExploreOgram
 from PlanetProfile.Plotting.ProfilePlots import PlotInductOgram, PlotExploreOgram
 from PlanetProfile.Test.TestBayes import TestBayes
+from PlanetProfile.MagneticInduction.MagneticInduction import SolveForQ, WriteMoments, ReloadMoments, \
+    WriteInductOgramMoments, ReloadInductOgramMoments
+from PlanetProfile.Utilities.defineStructs import Constants, PlanetStruct, DataFilesSubstruct
+from MoonMag.symmetry_funcs import InducedAeList as AeList
 
 # Include timestamps in messages and force debug level logging for all testing
 log = logging.getLogger('PlanetProfile')
@@ -46,6 +50,12 @@ def full():
     Params.DO_INDUCTOGRAM = False
     Params.SKIP_INDUCTION = False
 
+    # Check the numeric induction solution before running full profiles
+    TestEckhardtSolve()
+    TestEckhardtBlocks()
+    TestMomentsReload(Params)
+    TestInductOgramMomentsReload(Params)
+
     # Get total number of test files to run
     fList = fnmatch.filter(os.listdir(_Test), 'PPTest*')
     fList = [fName for fName in fList if 'Induct' not in fName and 'Bayes' not in fName and 'Explore' not in fName]
@@ -123,6 +133,154 @@ def full():
     return
 
 
+def TestEckhardtSolve():
+    """ Check the numeric (Eckhardt, 1963) induction solution against the layered
+        (Srivastava, 1966) solution for a Europa-like body with a thin conducting ocean.
+    """
+    rBds_m = np.array([700e3, 1440e3, 1531e3, 1561e3])
+    sigma_Sm = np.array([1e-8, 1e-8, 3.0, 1e-8])
+    Texc_hr = np.array([3.55, 5.62, 9.92, 11.23, 85.2, 1000.0])
+    omegaExc_radps = 2*np.pi / Texc_hr / 3600
+    k_pm = np.sqrt(1j * Constants.mu0 * omegaExc_radps[:, np.newaxis] * sigma_Sm[np.newaxis, :])
+    for n in [1, 2]:
+        AeLayer = AeList(rBds_m, sigma_Sm, omegaExc_radps, 1.0, nn=n, do_parallel=False)[0]
+        for solveMethod, rtol in [('dop853', 1e-5), ('dopri5', 1e-5), ('lsoda', 1e-4), ('vode', 1e-3),
+                                  ('zvode', 1e-3), ('RK45', 1e-2)]:
+            AeNumeric = SolveForQ(n, k_pm, rBds_m, rBds_m[-1], solveMethod) * (n+1) / n
+            np.testing.assert_allclose(AeNumeric, AeLayer, rtol=rtol,
+                                       err_msg=f'Eckhardt1963 solution with {solveMethod} for n = {n} ' +
+                                               'does not match Srivastava1966.')
+    log.info('Eckhardt1963 induction solutions match Srivastava1966 for all solve methods.')
+    return
+
+
+def TestEckhardtBlocks():
+    """ Check that numeric induction results do not depend on how excitation frequencies
+        are split into blocks across processes, i.e. on Params.maxCores.
+    """
+    rBds_m = np.array([700e3, 1440e3, 1531e3, 1561e3])
+    sigma_Sm = np.array([1e-8, 1e-8, 3.0, 1e-8])
+    Texc_hr = np.array([3.55, 5.62, 9.92, 11.23, 85.2, 1000.0])
+    omegaExc_radps = 2*np.pi / Texc_hr / 3600
+    k_pm = np.sqrt(1j * Constants.mu0 * omegaExc_radps[:, np.newaxis] * sigma_Sm[np.newaxis, :])
+    for solveMethod in ['dop853', 'lsoda', 'RK45']:
+        for n in [1, 2]:
+            Qall = SolveForQ(n, k_pm, rBds_m, rBds_m[-1], solveMethod)
+            for nBlocks in [2, 3, np.size(Texc_hr)]:
+                Qblocks = np.concatenate([SolveForQ(n, kBlock_pm, rBds_m, rBds_m[-1], solveMethod)
+                                          for kBlock_pm in np.array_split(k_pm, nBlocks)])
+                np.testing.assert_array_equal(Qblocks, Qall,
+                                              err_msg=f'Eckhardt1963 solution with {solveMethod} for n = {n} ' +
+                                                      f'changes when split into {nBlocks} blocks.')
+    log.info('Eckhardt1963 induction solutions are independent of frequency blocks.')
+    return
+
+
+def TestMomentsReload(Params):
+    """ Check that induced moments saved as .mat and as .npz files reload to the values saved.
+    """
+    nExc, nprmMax = 3, 2
+    Nnm = nprmMax * (nprmMax + 2)
+    rng = np.random.default_rng(0)
+    Planet = PlanetStruct('Test')
+    Planet.Magnetic.Benm_nT = rng.normal(size=(nExc, 2, nprmMax+1, nprmMax+1)) \
+                              + 1j*rng.normal(size=(nExc, 2, nprmMax+1, nprmMax+1))
+    Planet.Magnetic.Binm_nT = (0.5 * Planet.Magnetic.Benm_nT).astype(Params.Induct.BinmDtype)
+    Planet.Magnetic.omegaExc_radps = 2*np.pi / np.array([11.23, 85.2, 5.62]) / 3600
+    Planet.Magnetic.BinmLin_nT = (rng.normal(size=(nExc, Nnm)) + 1j*rng.normal(size=(nExc, Nnm))).astype(Params.Induct.BinmDtype)
+    Planet.Magnetic.nLin = np.array([n for n in range(1, nprmMax+1) for _ in range(-n, n+1)], dtype=np.int_)
+    Planet.Magnetic.mLin = np.array([m for n in range(1, nprmMax+1) for m in range(-n, n+1)], dtype=np.int_)
+    Planet.Magnetic.nprmLin = Planet.Magnetic.nLin
+    Planet.Magnetic.mprmLin = Planet.Magnetic.mLin
+    Planet.Magnetic.Bi1xyz_nT = {xyz: rng.normal(size=nExc) + 1j*rng.normal(size=nExc) for xyz in ['x', 'y', 'z']}
+    Planet.Magnetic.Aen = rng.normal(size=(nExc, nprmMax+1)) + 1j*rng.normal(size=(nExc, nprmMax+1))
+    Planet.Magnetic.asymShape_m = np.zeros((4, 2, 1, 1))
+    Planet.Magnetic.ionosBounds_m = np.array([100e3])
+    Planet.Magnetic.calcedExc = ['synodic', 'orbital', 'true anomaly']
+
+    DataFiles, SAVE_NPZ = Params.DataFiles, Params.Induct.SAVE_NPZ
+    with tempfile.TemporaryDirectory() as tmpDir:
+        Params.DataFiles = DataFilesSubstruct(tmpDir, 'Test', '')
+        for SAVE_NPZ_TEST, momentsFile in [(False, Params.DataFiles.inducedMomentsFile),
+                                           (True, Params.DataFiles.inducedMomentsNpzFile)]:
+            Params.Induct.SAVE_NPZ = SAVE_NPZ_TEST
+            WriteMoments(Planet, Params)
+            PlanetReload = ReloadMoments(PlanetStruct('Test'), momentsFile)
+            for name in ['Benm_nT', 'Binm_nT', 'omegaExc_radps', 'BinmLin_nT', 'nLin', 'mLin', 'nprmLin', 'mprmLin',
+                         'Aen', 'asymShape_m', 'ionosBounds_m']:
+                np.testing.assert_array_equal(getattr(PlanetReload.Magnetic, name), getattr(Planet.Magnetic, name),
+                                              err_msg=f'Magnetic.{name} changed on reload from {momentsFile}.')
+            for xyz in ['x', 'y', 'z']:
+                np.testing.assert_array_equal(PlanetReload.Magnetic.Bi1xyz_nT[xyz], Planet.Magnetic.Bi1xyz_nT[xyz],
+                                              err_msg=f'Magnetic.Bi1xyz_nT[{xyz}] changed on reload from {momentsFile}.')
+            np.testing.assert_array_equal(PlanetReload.Magnetic.calcedExc, Planet.Magnetic.calcedExc,
+                                          err_msg=f'Magnetic.calcedExc changed on reload from {momentsFile}.')
+    Params.DataFiles, Params.Induct.SAVE_NPZ = DataFiles, SAVE_NPZ
+    log.info('Induced moments reload correctly from both .mat and .npz files.')
+    return
+
+
+def TestInductOgramMomentsReload(Params):
+    """ Check that induced moments for a small induct-o-gram grid saved to a single .mat or
+        .npz file reload to the grid Planet each set of moments was calculated for.
+    """
+    nExc, nprmMax = 2, 1
+    Nnm = nprmMax * (nprmMax + 2)
+    rng = np.random.default_rng(1)
+    Benm_nT = rng.normal(size=(nExc, 2, nprmMax+1, nprmMax+1)) + 1j*rng.normal(size=(nExc, 2, nprmMax+1, nprmMax+1))
+    PlanetGrid = np.empty((2, 3), dtype=object)
+    k = 1
+    for i in range(2):
+        for j in range(3):
+            Planet = PlanetStruct('Test')
+            Planet.index = k
+            k += 1
+            Planet.Magnetic.Benm_nT = Benm_nT
+            Planet.Magnetic.omegaExc_radps = 2*np.pi / np.array([11.23, 85.2]) / 3600
+            Planet.Magnetic.nLin = np.array([1, 1, 1], dtype=np.int_)
+            Planet.Magnetic.mLin = np.array([-1, 0, 1], dtype=np.int_)
+            Planet.Magnetic.nprmLin = Planet.Magnetic.nLin
+            Planet.Magnetic.mprmLin = Planet.Magnetic.mLin
+            Planet.Magnetic.calcedExc = ['synodic', 'orbital']
+            Planet.Magnetic.Binm_nT = (rng.normal(size=(nExc, 2, nprmMax+1, nprmMax+1))
+                                       + 1j*rng.normal(size=(nExc, 2, nprmMax+1, nprmMax+1))).astype(Params.Induct.BinmDtype)
+            Planet.Magnetic.BinmLin_nT = (rng.normal(size=(nExc, Nnm)) + 1j*rng.normal(size=(nExc, Nnm))).astype(Params.Induct.BinmDtype)
+            Planet.Magnetic.Bi1xyz_nT = {xyz: rng.normal(size=nExc) + 1j*rng.normal(size=nExc) for xyz in ['x', 'y', 'z']}
+            Planet.Magnetic.Aen = rng.normal(size=(nExc, nprmMax+1)) + 1j*rng.normal(size=(nExc, nprmMax+1))
+            PlanetGrid[i,j] = Planet
+    # Invalid models are not saved and must not pick up another model's moments
+    PlanetGrid[1,0].Do.VALID = False
+
+    DataFiles, SAVE_NPZ = Params.DataFiles, Params.Induct.SAVE_NPZ
+    with tempfile.TemporaryDirectory() as tmpDir:
+        Params.DataFiles = DataFilesSubstruct(tmpDir, 'Test', '')
+        for SAVE_NPZ_TEST, momentsFile in [(False, Params.DataFiles.inductOgramMomentsFile),
+                                           (True, Params.DataFiles.inductOgramMomentsNpzFile)]:
+            Params.Induct.SAVE_NPZ = SAVE_NPZ_TEST
+            WriteInductOgramMoments(PlanetGrid, Params)
+            ReloadGrid = np.empty_like(PlanetGrid)
+            for i, j in np.ndindex(PlanetGrid.shape):
+                ReloadGrid[i,j] = PlanetStruct('Test')
+                ReloadGrid[i,j].index = PlanetGrid[i,j].index
+            ReloadGrid = ReloadInductOgramMoments(ReloadGrid, momentsFile)
+            for i, j in np.ndindex(PlanetGrid.shape):
+                Planet, PlanetReload = PlanetGrid[i,j], ReloadGrid[i,j]
+                if not Planet.Do.VALID:
+                    if PlanetReload.Magnetic.Aen is not None:
+                        raise AssertionError(f'Invalid model {Planet.index} was assigned moments on reload from {momentsFile}.')
+                    continue
+                for name in ['Benm_nT', 'Binm_nT', 'omegaExc_radps', 'BinmLin_nT', 'nLin', 'mLin', 'nprmLin', 'mprmLin',
+                             'Aen', 'calcedExc']:
+                    np.testing.assert_array_equal(getattr(PlanetReload.Magnetic, name), getattr(Planet.Magnetic, name),
+                        err_msg=f'Magnetic.{name} for model {Planet.index} changed on reload from {momentsFile}.')
+                for xyz in ['x', 'y', 'z']:
+                    np.testing.assert_array_equal(PlanetReload.Magnetic.Bi1xyz_nT[xyz], Planet.Magnetic.Bi1xyz_nT[xyz],
+                        err_msg=f'Magnetic.Bi1xyz_nT[{xyz}] for model {Planet.index} changed on reload from {momentsFile}.')
+    Params.DataFiles, Params.Induct.SAVE_NPZ = DataFiles, SAVE_NPZ
+    log.info('Induct-o-gram induced moments reload to the correct grid models from both .mat and .npz files.')
+    return
+
+
 def TestAllInductOgrams(TestPlanets, Params, tMarks):
     # Run all types of inductogram on Test7, with Test11 for porosity
     Params.DO_INDUCTOGRAM = True
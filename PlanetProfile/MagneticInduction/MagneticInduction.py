@@ -4,8 +4,8 @@ import logging
 import scipy.interpolate as spi
 import scipy.special as sps
 import spiceypy as spice
-from scipy.integrate import solve_ivp as ODEsolve
-from collections.abc import Iterable
+from functools import lru_cache
+from scipy.integrate import solve_ivp as ODEsolve, ode as ODEintegrator, complex_ode as ComplexODEintegrator
 from glob import glob as FilesMatchingPattern
 from scipy.io import savemat, loadmat
 from PlanetProfile import _Test, _Defaults
@@ -14,11 +14,16 @@ from PlanetProfile.Utilities.Trajectories import BodyDist_km
 from PlanetProfile.MagneticInduction.Moments import Excitations
 from PlanetProfile.GetConfig import FigMisc
 from MoonMag.asymmetry_funcs import read_Benm as GetBenm, BiList as BiAsym, get_chipq_from_CSpq as GeodesyNorm2chipq, \
-    get_all_Xid as LoadXid, get_rsurf as GetrSurf
+    get_all_Xid as LoadXid
 from MoonMag.symmetry_funcs import InducedAeList as AeList
 
+# Parallel processing
+import multiprocessing as mtp
+mtpFork = mtp.get_context('fork')
 # Assign logger
 log = logging.getLogger('PlanetProfile')
+# Conversion from period in hr to angular frequency in rad/s: omega = TWOPI_PER_HR / T_hr
+TWOPI_PER_HR = 2*np.pi / 3600
 
 def MagneticInduction(Planet, Params, fNameOverride=None):
     """ Calculate induced magnetic moments for the body and prints them to disk.
@@ -42,11 +47,15 @@ def MagneticInduction(Planet, Params, fNameOverride=None):
     elif Planet.Do.VALID:
         # Reload induced moments from disk
         if fNameOverride is None:
-            momentsFile = Params.DataFiles.inducedMomentsFile
+            if Params.Induct.SAVE_NPZ:
+                momentsFile = Params.DataFiles.inducedMomentsNpzFile
+            else:
+                momentsFile = Params.DataFiles.inducedMomentsFile
         else:
             momentsFile = fNameOverride
 
         if os.path.isfile(momentsFile):
+            log.debug(f'Reloading induced moments from file: {momentsFile}')
             Planet = ReloadMoments(Planet, momentsFile)
         else:
             log.warning(f'CALC_NEW_INDUCT is False, but {momentsFile} was not found. ' +
@@ -90,27 +99,43 @@ def CalcInducedMoments(Planet, Params):
     # Get lists of n and m values for linearizing Binm after we calculate. Also needed for
     # asymmetric layer calculations, so we do this first.
     nMax = Planet.Magnetic.nprmMax + Planet.Magnetic.pMax
-    Planet.Magnetic.nLin = [n for n in range(1, nMax+1) for _ in range(-n, n+1)]
-    Planet.Magnetic.mLin = [m for n in range(1, nMax+1) for m in range(-n, n+1)]
-    Planet.Magnetic.nprmLin = [n for n in range(1, Planet.Magnetic.nprmMax+1) for _ in range(-n, n+1)]
-    Planet.Magnetic.mprmLin = [m for n in range(1, Planet.Magnetic.nprmMax+1) for m in range(-n, n+1)]
+    Planet.Magnetic.nLin = np.array([n for n in range(1, nMax+1) for _ in range(-n, n+1)], dtype=np.int_)
+    Planet.Magnetic.mLin = np.array([m for n in range(1, nMax+1) for m in range(-n, n+1)], dtype=np.int_)
+    Planet.Magnetic.nprmLin = np.array([n for n in range(1, Planet.Magnetic.nprmMax+1) for _ in range(-n, n+1)], dtype=np.int_)
+    Planet.Magnetic.mprmLin = np.array([m for n in range(1, Planet.Magnetic.nprmMax+1) for m in range(-n, n+1)], dtype=np.int_)
     Nnm = np.size(Planet.Magnetic.nLin)
 
     Planet.Magnetic.Aen = np.zeros((Planet.Magnetic.nExc, Planet.Magnetic.nprmMax+1), dtype=np.complex_)
-    Planet.Magnetic.BinmLin_nT = np.zeros((Planet.Magnetic.nExc, Nnm), dtype=np.complex_)
+    Planet.Magnetic.BinmLin_nT = np.zeros((Planet.Magnetic.nExc, Nnm), dtype=Params.Induct.BinmDtype)
     if Planet.Magnetic.inductMethod == 'Eckhardt1963' or Planet.Magnetic.inductMethod == 'numeric':
         if Params.Sig.INCLUDE_ASYM:
             log.warning('Asymmetry can only be modeled with Srivastava1966 (layer) method, but ' +
                         'Eckhardt1963 (numeric) method is selected. Asymmetry will be ignored.')
 
         # Get wavenumbers for each layer for each frequency
-        k_pm = np.array([np.sqrt(1j * Constants.mu0 * omega * Planet.Magnetic.sigmaLayers_Sm)
-                     for omega in Planet.Magnetic.omegaExc_radps])
+        k_pm = np.sqrt(1j * Constants.mu0 * np.asarray(Planet.Magnetic.omegaExc_radps)[:, np.newaxis]
+                       * np.asarray(Planet.Magnetic.sigmaLayers_Sm)[np.newaxis, :])
+
+        # Integrations are independent across excitation frequencies, so we can split them
+        # into blocks for separate processes, unless we are already running in parallel
+        if Params.DO_PARALLEL and not (Params.INDUCTOGRAM_IN_PROGRESS or Params.DO_EXPLOREOGRAM):
+            nCores = np.min([Params.maxCores, Planet.Magnetic.nExc, Params.threadLimit])
+        else:
+            nCores = 1
 
         for nprm in range(1, Planet.Magnetic.nprmMax+1):
-            Q = np.array([SolveForQ(nprm, k_pm[i,:], Planet.Magnetic.rSigChange_m, Planet.Bulk.R_m,
-                                    Params.Induct.EckhardtSolveMethod, rMin=Params.Induct.rMinODE)
-                                    for i,omega in enumerate(Planet.Magnetic.omegaExc_radps)])
+            if nCores > 1:
+                pool = mtpFork.Pool(nCores)
+                parResult = [pool.apply_async(SolveForQ, (nprm, kBlock_pm, Planet.Magnetic.rSigChange_m, Planet.Bulk.R_m,
+                                                          Params.Induct.EckhardtSolveMethod),
+                                              {'rMin': Params.Induct.rMinODE})
+                             for kBlock_pm in np.array_split(k_pm, nCores)]
+                pool.close()
+                pool.join()
+                Q = np.concatenate([result.get() for result in parResult])
+            else:
+                Q = SolveForQ(nprm, k_pm, Planet.Magnetic.rSigChange_m, Planet.Bulk.R_m,
+                              Params.Induct.EckhardtSolveMethod, rMin=Params.Induct.rMinODE)
             Planet.Magnetic.Aen[:,nprm] = Q * (nprm+1) / nprm
             Planet.Magnetic.Binm_nT[:,:,nprm,:] = [Planet.Magnetic.Benm_nT[i,:,nprm,:] * Planet.Magnetic.Aen[i,nprm]
                                                    for i in range(Planet.Magnetic.nExc)]
@@ -125,11 +150,27 @@ def CalcInducedMoments(Planet, Params):
                      Planet.Magnetic.omegaExc_radps, 1/Planet.Bulk.R_m, nn=1,
                      writeout=False, do_parallel=not (Params.INDUCTOGRAM_IN_PROGRESS or Params.DO_EXPLOREOGRAM))
         Planet.Magnetic.phase = -np.degrees(AeArg)
-        for n in range(2, Planet.Magnetic.nprmMax):
-            Planet.Magnetic.Aen[:,n], _, _ \
-                = AeList(Planet.Magnetic.rSigChange_m, Planet.Magnetic.sigmaLayers_Sm,
-                         Planet.Magnetic.omegaExc_radps, 1/Planet.Bulk.R_m, nn=n,
-                         writeout=False, do_parallel=not (Params.INDUCTOGRAM_IN_PROGRESS or Params.DO_EXPLOREOGRAM))
+        nList = np.arange(2, Planet.Magnetic.nprmMax)
+        if Params.DO_PARALLEL and not (Params.INDUCTOGRAM_IN_PROGRESS or Params.DO_EXPLOREOGRAM):
+            nCores = np.min([Params.maxCores, np.size(nList), Params.threadLimit])
+        else:
+            nCores = 1
+        if nCores > 1:
+            # Each degree n is independent, so we evaluate them in separate processes instead
+            pool = mtpFork.Pool(nCores)
+            parResult = [pool.apply_async(AeList, (Planet.Magnetic.rSigChange_m, Planet.Magnetic.sigmaLayers_Sm,
+                                                   Planet.Magnetic.omegaExc_radps, 1/Planet.Bulk.R_m),
+                                          {'nn': n, 'writeout': False, 'do_parallel': False})
+                         for n in nList]
+            pool.close()
+            pool.join()
+            Planet.Magnetic.Aen[:, nList] = np.stack([result.get()[0] for result in parResult], axis=1)
+        else:
+            for n in nList:
+                Planet.Magnetic.Aen[:,n], _, _ \
+                    = AeList(Planet.Magnetic.rSigChange_m, Planet.Magnetic.sigmaLayers_Sm,
+                             Planet.Magnetic.omegaExc_radps, 1/Planet.Bulk.R_m, nn=n,
+                             writeout=False, do_parallel=not (Params.INDUCTOGRAM_IN_PROGRESS or Params.DO_EXPLOREOGRAM))
 
         if Params.Sig.INCLUDE_ASYM:
             # Use a separate function for evaluating asymmetric induced moments, as Binm is not as simple as
@@ -140,67 +181,147 @@ def CalcInducedMoments(Planet, Params):
                                              Planet.Magnetic.nLin, Planet.Magnetic.mLin, Planet.Magnetic.pMax,
                                              nprm_max=Planet.Magnetic.nprmMax, writeout=False,
                                              do_parallel=not (Params.INDUCTOGRAM_IN_PROGRESS or Params.DO_EXPLOREOGRAM),
-                                             Xid=Planet.Magnetic.Xid)
+                                             Xid=Planet.Magnetic.Xid).astype(Params.Induct.BinmDtype, copy=False)
         else:
             # Multiply complex response by Benm to get Binm for spherically symmetric case
-            for iPeak in range(Planet.Magnetic.nExc):
-                for n in Planet.Magnetic.nprmLin:
-                    for m in Planet.Magnetic.mprmLin:
-                        Planet.Magnetic.Binm_nT[iPeak, int(m<0), n, m] \
-                            = n/(n+1) * Planet.Magnetic.Benm_nT[iPeak, int(m<0), n, m] * Planet.Magnetic.Aen[iPeak, n]
+            nprm = np.arange(Planet.Magnetic.nprmMax+1)
+            Planet.Magnetic.Binm_nT[:, :, :Planet.Magnetic.nprmMax+1, :] \
+                = (nprm / (nprm+1))[np.newaxis, np.newaxis, :, np.newaxis] \
+                * Planet.Magnetic.Benm_nT[:, :, :Planet.Magnetic.nprmMax+1, :] \
+                * Planet.Magnetic.Aen[:, np.newaxis, :, np.newaxis]
     else:
         raise ValueError(f'Induction method "{Planet.Magnetic.inductMethod}" not defined.')
 
     # Get linear lists of Binm for more convenient post-processing
-    Planet.Magnetic.BinmLin_nT[:,:Nnm] \
-        = np.array([[Planet.Magnetic.Binm_nT[iPeak,int(m<0),n,m]
-                   for n, m in zip(Planet.Magnetic.nLin, Planet.Magnetic.mLin)]
-                   for iPeak in range(Planet.Magnetic.nExc)])
+    Planet.Magnetic.BinmLin_nT[:,:Nnm] = Planet.Magnetic.Binm_nT[:, (Planet.Magnetic.mLin<0).astype(np.int_),
+                                                                 Planet.Magnetic.nLin, Planet.Magnetic.mLin]
 
     # Get surface strength in IAU components for plotting, with conjugate phase to match
     # Zimmer et al. (2000) phase convention
-    Bex, Bey, Bez = Benm2absBexyz(Planet.Magnetic.Benm_nT)
+    Bi1xyz_nT = np.stack(Benm2absBexyz(Planet.Magnetic.Benm_nT)) * np.conj(Planet.Magnetic.Aen[:,1])[np.newaxis, :]
     Planet.Magnetic.Bi1xyz_nT = {
-        'x': Bex * np.conj(Planet.Magnetic.Aen[:,1]),
-        'y': Bey * np.conj(Planet.Magnetic.Aen[:,1]),
-        'z': Bez * np.conj(Planet.Magnetic.Aen[:,1])
+        'x': Bi1xyz_nT[0, :],
+        'y': Bi1xyz_nT[1, :],
+        'z': Bi1xyz_nT[2, :]
     }
 
     Planet.Magnetic.calcedExc = [key for key, CALCED in Params.Induct.excSelectionCalc.items()
                                  if CALCED and Excitations.Texc_hr[Planet.bodyname][key] is not None]
-    # Save calculated magnetic moments to disk
-    if not Params.NO_SAVEFILE:
-        saveDict = {
-            'Benm_nT': Planet.Magnetic.Benm_nT,
-            'Binm_nT': Planet.Magnetic.Binm_nT,
-            'omegaExc_radps': Planet.Magnetic.omegaExc_radps,
-            'BinmLin_nT': Planet.Magnetic.BinmLin_nT,
-            'nLin': Planet.Magnetic.nLin,
-            'mLin': Planet.Magnetic.mLin,
-            'nprmLin': Planet.Magnetic.nprmLin,
-            'mprmLin': Planet.Magnetic.mprmLin,
-            'Bi1x_nT': Planet.Magnetic.Bi1xyz_nT['x'],
-            'Bi1y_nT': Planet.Magnetic.Bi1xyz_nT['y'],
-            'Bi1z_nT': Planet.Magnetic.Bi1xyz_nT['z'],
-            'Aen': Planet.Magnetic.Aen,
-            'asymShape_m': Planet.Magnetic.asymShape_m,
-            'ionosBounds_m': Planet.Magnetic.ionosBounds_m,
-            'calcedExc': Planet.Magnetic.calcedExc
-        }
+    # Save calculated magnetic moments to disk. During induct-o-grams, we instead write all
+    # points together to a single file once the grid is complete, in WriteInductOgramMoments.
+    if not (Params.NO_SAVEFILE or Params.INDUCTOGRAM_IN_PROGRESS):
+        WriteMoments(Planet, Params)
+
+    return Planet
+
+
+def WriteMoments(Planet, Params):
+    """ Save induced moments for a single model to disk, as .npz if Params.Induct.SAVE_NPZ
+        is set and as .mat otherwise. ReloadMoments reads either format.
+    """
+    saveDict = {
+        'Benm_nT': Planet.Magnetic.Benm_nT,
+        'Binm_nT': Planet.Magnetic.Binm_nT,
+        'omegaExc_radps': Planet.Magnetic.omegaExc_radps,
+        'BinmLin_nT': Planet.Magnetic.BinmLin_nT,
+        'nLin': Planet.Magnetic.nLin,
+        'mLin': Planet.Magnetic.mLin,
+        'nprmLin': Planet.Magnetic.nprmLin,
+        'mprmLin': Planet.Magnetic.mprmLin,
+        'Bi1x_nT': Planet.Magnetic.Bi1xyz_nT['x'],
+        'Bi1y_nT': Planet.Magnetic.Bi1xyz_nT['y'],
+        'Bi1z_nT': Planet.Magnetic.Bi1xyz_nT['z'],
+        'Aen': Planet.Magnetic.Aen,
+        'asymShape_m': Planet.Magnetic.asymShape_m,
+        'ionosBounds_m': Planet.Magnetic.ionosBounds_m,
+        'calcedExc': Planet.Magnetic.calcedExc
+    }
+    if Params.Induct.SAVE_NPZ:
+        np.savez(Params.DataFiles.inducedMomentsNpzFile, **saveDict)
+        log.debug(f'Saved induced moments to file: {Params.DataFiles.inducedMomentsNpzFile}')
+    else:
         savemat(Params.DataFiles.inducedMomentsFile, saveDict)
         log.debug(f'Saved induced moments to file: {Params.DataFiles.inducedMomentsFile}')
 
-    return Planet
+    return
+
+
+def WriteInductOgramMoments(PlanetGrid, Params):
+    """ Save the induced moments for all models in an induct-o-gram to a single file,
+        in place of writing one file per model while the grid is calculated.
+    """
+    PlanetList1D = [Planet for Planet in np.reshape(PlanetGrid, -1)
+                    if Planet.Do.VALID and Planet.Magnetic.Aen is not None]
+    if np.size(PlanetList1D) == 0:
+        log.warning('No valid induct-o-gram models found. Induced moments will not be saved.')
+    else:
+        saveDict = {
+            'index': np.array([Planet.index for Planet in PlanetList1D]),
+            'Benm_nT': PlanetList1D[0].Magnetic.Benm_nT,
+            'omegaExc_radps': PlanetList1D[0].Magnetic.omegaExc_radps,
+            'nLin': PlanetList1D[0].Magnetic.nLin,
+            'mLin': PlanetList1D[0].Magnetic.mLin,
+            'nprmLin': PlanetList1D[0].Magnetic.nprmLin,
+            'mprmLin': PlanetList1D[0].Magnetic.mprmLin,
+            'calcedExc': PlanetList1D[0].Magnetic.calcedExc,
+            'Binm_nT': np.stack([Planet.Magnetic.Binm_nT for Planet in PlanetList1D]),
+            'BinmLin_nT': np.stack([Planet.Magnetic.BinmLin_nT for Planet in PlanetList1D]),
+            'Bi1x_nT': np.stack([Planet.Magnetic.Bi1xyz_nT['x'] for Planet in PlanetList1D]),
+            'Bi1y_nT': np.stack([Planet.Magnetic.Bi1xyz_nT['y'] for Planet in PlanetList1D]),
+            'Bi1z_nT': np.stack([Planet.Magnetic.Bi1xyz_nT['z'] for Planet in PlanetList1D]),
+            'Aen': np.stack([Planet.Magnetic.Aen for Planet in PlanetList1D])
+        }
+        if Params.Induct.SAVE_NPZ:
+            momentsFile = Params.DataFiles.inductOgramMomentsNpzFile
+            np.savez(momentsFile, **saveDict)
+        else:
+            momentsFile = Params.DataFiles.inductOgramMomentsFile
+            savemat(momentsFile, saveDict)
+        log.debug(f'Saved induced moments for {np.size(PlanetList1D)} induct-o-gram models to file: {momentsFile}')
+
+    return
+
+
+def ReloadInductOgramMoments(PlanetGrid, momentsFile):
+    """ Reload induced moments saved by WriteInductOgramMoments, matching each saved
+        model to the Planet in PlanetGrid with the same index. Planets with no saved
+        moments (e.g. invalid models) are left unchanged.
+    """
+
+    reload = LoadmatCached(momentsFile)
+    iSaved = {index: i for i, index in enumerate(reload['index'][0])}
+    for Planet in np.reshape(PlanetGrid, -1):
+        if Planet.index in iSaved.keys():
+            i = iSaved[Planet.index]
+            Planet.Magnetic.Benm_nT = reload['Benm_nT']
+            Planet.Magnetic.omegaExc_radps = reload['omegaExc_radps'][0]
+            Planet.Magnetic.nLin = reload['nLin'][0]
+            Planet.Magnetic.mLin = reload['mLin'][0]
+            Planet.Magnetic.nprmLin = reload['nprmLin'][0]
+            Planet.Magnetic.mprmLin = reload['mprmLin'][0]
+            Planet.Magnetic.calcedExc = np.char.strip(reload['calcedExc'])
+            Planet.Magnetic.Binm_nT = reload['Binm_nT'][i]
+            Planet.Magnetic.BinmLin_nT = reload['BinmLin_nT'][i]
+            Planet.Magnetic.Bi1xyz_nT = {
+                'x': reload['Bi1x_nT'][i],
+                'y': reload['Bi1y_nT'][i],
+                'z': reload['Bi1z_nT'][i]
+            }
+            Planet.Magnetic.Aen = reload['Aen'][i]
+            Planet.Magnetic.nExc = np.size(Planet.Magnetic.omegaExc_radps)
+    log.debug(f'Reloaded induced moments for {len(iSaved)} induct-o-gram models from file: {momentsFile}')
+
+    return PlanetGrid
 
 
 def ReloadMoments(Planet, momentsFile):
     """ Reload induced moments from disk """
     
-    reload = loadmat(momentsFile)
+    reload = LoadmatCached(momentsFile)
     Planet.Magnetic.Benm_nT = reload['Benm_nT']
     Planet.Magnetic.Binm_nT = reload['Binm_nT']
     Planet.Magnetic.omegaExc_radps = reload['omegaExc_radps'][0]
-    Planet.Magnetic.BinmLin_nT = reload['BinmLin_nT'][0]
+    Planet.Magnetic.BinmLin_nT = reload['BinmLin_nT']
     Planet.Magnetic.nLin = reload['nLin'][0]
     Planet.Magnetic.mLin = reload['mLin'][0]
     Planet.Magnetic.nprmLin = reload['nprmLin'][0]
@@ -219,27 +340,54 @@ def ReloadMoments(Planet, momentsFile):
     return Planet
 
 
+def LoadmatCached(fName):
+    """ Load a .mat file from disk, reusing the previous result if the same file
+        has already been loaded and has not been modified since. Arrays in the
+        returned dict are copies, so callers may modify them in place.
+        .npz files are also accepted. Their numeric 1D arrays are returned as rows and
+        string arrays are left 1D, to match the layout returned by loadmat.
+    """
+    fPath = os.path.abspath(fName)
+    fStat = os.stat(fPath)
+    reload = _LoadmatByStat(fPath, fStat.st_mtime_ns, fStat.st_size)
+    return {key: val.copy() if isinstance(val, np.ndarray) else val for key, val in reload.items()}
+
+
+@lru_cache(maxsize=32)
+def _LoadmatByStat(fPath, mtime_ns, size_B):
+    if os.path.splitext(fPath)[1] == '.npz':
+        reload = {}
+        with np.load(fPath) as npzFile:
+            for key in npzFile.files:
+                # loadmat returns string lists (e.g. calcedExc) as 1D arrays, so only numeric arrays become rows
+                arr = npzFile[key]
+                reload[key] = arr if arr.dtype.kind == 'U' else np.atleast_2d(arr)
+    else:
+        reload = loadmat(fPath)
+    # Cached arrays are shared by every later load of this file, so make sure they cannot be changed
+    for val in reload.values():
+        if isinstance(val, np.ndarray):
+            val.flags.writeable = False
+    return reload
+
+
 def CalcAsymContours(Planet, Params):
 
     if Params.Sig.INCLUDE_ASYM:
         # Make a calculation for each loaded asymmetry file and the gravity shape
-        Planet.Magnetic.asymDevs_km = np.zeros((Planet.Magnetic.nAsymBds, FigMisc.nLatMap, FigMisc.nLonMap))
-        for i, iLayer, zMean_km in zip(range(Planet.Magnetic.nAsymBds), Planet.Magnetic.iAsymBds, Planet.Magnetic.zMeanAsym_km):
-            log.debug(f'Calculating topographic data for zMean = {zMean_km:.1f} km depth with {360/FigMisc.nLonMap:.1f}° resolution. This may take some time.')
-            if i == Planet.Magnetic.nAsymBds - 1:
-                rSurf_m = np.real(GetrSurf(Planet.Magnetic.pLin, Planet.Magnetic.qLin, Planet.Magnetic.gravShape_m[iLayer, ...],
-                                           Planet.Bulk.R_m, FigMisc.thetaMap_rad, FigMisc.phiMap_rad,
-                                           do_parallel=Params.DO_PARALLEL and not (Params.INDUCTOGRAM_IN_PROGRESS or Params.DO_EXPLOREOGRAM)))
-            else:
-                rSurf_m = np.real(GetrSurf(Planet.Magnetic.pLin, Planet.Magnetic.qLin, Planet.Magnetic.asymShape_m[iLayer, ...],
-                                           Planet.Bulk.R_m - zMean_km*1e3, FigMisc.thetaMap_rad, FigMisc.phiMap_rad,
-                                           do_parallel=Params.DO_PARALLEL and not (Params.INDUCTOGRAM_IN_PROGRESS or Params.DO_EXPLOREOGRAM)))
-
-            # Plot as depth
-            Planet.Magnetic.asymDevs_km[i, ...] = (Planet.Bulk.R_m - rSurf_m) / 1e3
-            if zMean_km <= 0:
-                # For asymmetry at the surface and above, plot as elevation/altitudes and not depth
-                Planet.Magnetic.asymDevs_km[i, ...] = -1 * Planet.Magnetic.asymDevs_km[i, ...]
+        log.debug(f'Calculating topographic data for {Planet.Magnetic.nAsymBds} boundaries with ' +
+                  f'{360/FigMisc.nLonMap:.1f}° resolution. This may take some time.')
+        asymShapes_m = np.array([Planet.Magnetic.gravShape_m[iLayer, ...] if i == Planet.Magnetic.nAsymBds - 1
+                                 else Planet.Magnetic.asymShape_m[iLayer, ...]
+                                 for i, iLayer in enumerate(Planet.Magnetic.iAsymBds)])
+        rMean_m = Planet.Bulk.R_m - np.append(Planet.Magnetic.zMeanAsym_km[:-1], 0) * 1e3
+        rSurf_m = GetrSurfAll(Planet.Magnetic.pLin, Planet.Magnetic.qLin, asymShapes_m, rMean_m,
+                              FigMisc.thetaMap_rad, FigMisc.phiMap_rad)
+
+        # Plot as depth, except for asymmetry at the surface and above, which we plot as
+        # elevation/altitudes. Both the sign and unit conversion are applied in place.
+        Planet.Magnetic.asymDevs_km = np.subtract(Planet.Bulk.R_m, rSurf_m, out=rSurf_m)
+        Planet.Magnetic.asymDevs_km *= np.where(Planet.Magnetic.zMeanAsym_km <= 0, -1e-3, 1e-3)[:, np.newaxis, np.newaxis]
 
         # Save calculated boundary deviations to disk
         if not Params.NO_SAVEFILE:
@@ -272,7 +420,7 @@ def ReloadAsym(Planet, Params, fNameOverride=None):
                   'plotting will be skipped.')
         Params.CALC_ASYM = False
     else:
-        reload = loadmat(asymFile)
+        reload = LoadmatCached(asymFile)
         Planet.Magnetic.nAsymBds = reload['nAsymBds'][0]
         Planet.Magnetic.iAsymBds = reload['iAsymBds'][0]
         Planet.Magnetic.zMeanAsym_km = reload['zMeanAsym_km'][0]
@@ -291,7 +439,7 @@ def ReloadAsym(Planet, Params, fNameOverride=None):
         # Adjust longitudes in case we change DO_360 between calculations
         if (FigMisc.DO_360 and Planet.lonMap_deg[0] < 0) or \
            (not FigMisc.DO_360 and Planet.lonMap_deg[-1] > 180):
-            lonAdj_deg = Planet.lonMap_deg + 0
+            lonAdj_deg = Planet.lonMap_deg.copy()
             if FigMisc.DO_360:
                 lonAdj_deg[lonAdj_deg == -180] = 180.1
                 lonAdj_deg[lonAdj_deg < 0] = lonAdj_deg[lonAdj_deg < 0] + 360
@@ -302,7 +450,6 @@ def ReloadAsym(Planet, Params, fNameOverride=None):
                 iSort = np.argsort(lonAdj_deg)
 
             lonAdj_deg = lonAdj_deg[iSort]
-            rDevsAdj_km = Planet.Magnetic.asymDevs_km[:, :, iSort]
 
             # Stitch endpoints together if we adjusted the plotting coords
             if not (np.max(lonAdj_deg) == 180 or np.max(lonAdj_deg) == 360):
@@ -310,7 +457,13 @@ def ReloadAsym(Planet, Params, fNameOverride=None):
                     lonAdj_deg = np.append(lonAdj_deg, 360)
                 else:
                     lonAdj_deg = np.append(lonAdj_deg, 180)
-                rDevsAdj_km = np.append(rDevsAdj_km, rDevsAdj_km[:, :, 0:1], axis=2)
+                # Gather sorted longitudes directly into an output array with room for the repeated endpoint
+                nAsymBds, nLat, nLon = np.shape(Planet.Magnetic.asymDevs_km)
+                rDevsAdj_km = np.empty((nAsymBds, nLat, nLon+1))
+                np.take(Planet.Magnetic.asymDevs_km, iSort, axis=2, out=rDevsAdj_km[:, :, :-1], mode='wrap')
+                rDevsAdj_km[:, :, -1] = rDevsAdj_km[:, :, 0]
+            else:
+                rDevsAdj_km = np.take(Planet.Magnetic.asymDevs_km, iSort, axis=2)
 
             Planet.lonMap_deg = lonAdj_deg
             Planet.Magnetic.asymDevs_km = rDevsAdj_km
@@ -320,28 +473,102 @@ def ReloadAsym(Planet, Params, fNameOverride=None):
     return Planet
 
 
+def GetrSurfAll(pLin, qLin, asymShapes_m, rMean_m, thetaMap_rad, phiMap_rad):
+    """ Evaluate r(theta, phi) for several asymmetric boundaries at once, evaluating each
+        spherical harmonic Y_pq only once and applying it to all boundaries. Equivalent to
+        calling MoonMag's get_rsurf for each boundary in turn.
+
+        Args:
+            pLin, qLin (int, shape Npq): Linear lists of paired p,q values to include.
+            asymShapes_m (complex, shape nBds x 2 x pMax+1 x pMax+1): Fully normalized shape
+                coefficients chi_pq for each boundary in m.
+            rMean_m (float, shape nBds): Mean radius of each boundary in m.
+            thetaMap_rad (float, shape nLat): Colatitudes at which to evaluate.
+            phiMap_rad (float, shape nLon): East longitudes at which to evaluate.
+        Returns:
+            rSurf_m (float, shape nBds x nLat x nLon): Boundary radii at each map point.
+    """
+    theta_rad, phi_rad = np.meshgrid(thetaMap_rad, phiMap_rad, indexing='ij')
+    rSurf_m = np.zeros((np.size(rMean_m), np.size(thetaMap_rad), np.size(phiMap_rad)))
+    rSurf_m[...] = np.asarray(rMean_m)[:, np.newaxis, np.newaxis]
+    for p, q in zip(np.asarray(pLin, dtype=np.int_), np.asarray(qLin, dtype=np.int_)):
+        chipq_m = asymShapes_m[:, int(q<0), p, abs(q)]
+        if np.any(chipq_m != 0):
+            Ypq = sps.sph_harm(q, p, phi_rad, theta_rad)
+            rSurf_m += np.real(chipq_m[:, np.newaxis, np.newaxis] * Ypq[np.newaxis, ...])
+
+    return rSurf_m
+
+
 def SolveForQ(n, kBlw_pm, rBds_m, R_m, solveMethod, rMin=1e3):
-    dQdr = fn_dQdr(n, kBlw_pm, rBds_m)
-    Q = ODEsolve(dQdr, (rMin, rBds_m[-1]), [0j], method=solveMethod)
-    Q = Q['y'][0,-1] * (rBds_m[-1]/R_m)**(n+2)
+    """ Numerically integrate the Riccati equation for Q from Eckhardt (1963) for
+        each excitation frequency.
+
+        Args:
+            n (int): Degree n' of the excitation moment.
+            kBlw_pm (complex, shape nExc x nBds): Wavenumber of each layer below
+                each boundary, for each excitation frequency.
+            rBds_m (float, shape nBds): Upper boundary radius of each layer.
+            R_m (float): Body radius used for normalization.
+            solveMethod (str): Integration method. Integrator names accepted by scipy.integrate.ode
+                (e.g. 'dop853', 'lsoda') use the compiled integrators; other values are passed
+                to solve_ivp (e.g. 'RK45').
+            rMin = 1e3 (float): Radius at which to begin integration.
+        Returns:
+            Q (complex, shape nExc): Complex response for each excitation frequency.
+    """
+    kBlw_pm = np.atleast_2d(kBlw_pm)
+    # Integrate up to each boundary in turn, restarting the integrator there. Otherwise, adaptive
+    # steps grown across the insulating interior can skip over thin conducting layers entirely.
+    rStops_m = rBds_m[rBds_m > rMin]
+    COMPILED = solveMethod in ['lsoda', 'vode', 'zvode', 'dopri5', 'dop853']
+    Qtop = np.zeros(np.shape(kBlw_pm)[0], dtype=np.complex_)
+    # Each frequency is integrated on its own, so that adaptive step control (and so Q) does
+    # not depend on which other frequencies are solved alongside it
+    for iExc, kExc_pm in enumerate(kBlw_pm):
+        dQdr = fn_dQdr(n, kExc_pm[np.newaxis, :], rBds_m)
+        if COMPILED:
+            # Use the compiled FORTRAN integrators, which have much less per-step overhead than solve_ivp.
+            # zvode supports complex values directly; the others need the real and imaginary parts split.
+            if solveMethod == 'zvode':
+                solver = ODEintegrator(dQdr).set_integrator(solveMethod)
+            else:
+                solver = ComplexODEintegrator(dQdr).set_integrator(solveMethod)
+        Q = np.zeros(1, dtype=np.complex_)
+        rStart_m = rMin
+        for rStop_m in rStops_m:
+            if COMPILED:
+                solver.set_initial_value(Q, rStart_m)
+                Q = solver.integrate(rStop_m)
+                if not solver.successful():
+                    log.warning(f'ODE integrator "{solveMethod}" did not report success for n = {n}.')
+            else:
+                Q = ODEsolve(dQdr, (rStart_m, rStop_m), Q, method=solveMethod)['y'][:,-1]
+            rStart_m = rStop_m
+        Qtop[iExc] = Q[0]
+    Q = Qtop * (rBds_m[-1]/R_m)**(n+2)
     return Q
 
 
 class fn_dQdr:
     def __init__(self, n, kBlw_pm, rBds_m):
         self.n = n
-        self.kBlw_pm = kBlw_pm
-        self.rBds_m = rBds_m
-
-    def fn_k(self, r_m):
-        if not isinstance(r_m, Iterable):
-            r_m = np.array([r_m])
-        iNextAbove = [next((i for i, rBd_m in enumerate(self.rBds_m) if rBd_m >= ri_m)) for ri_m in r_m]
-        return self.kBlw_pm[iNextAbove]
+        self.rBds_m = np.ascontiguousarray(rBds_m, dtype=np.float_)
+        self.iTop = np.size(self.rBds_m) - 1
+        # Fold the constant n-dependent factors into k^2 once, stored layer-major so
+        # each lookup returns a contiguous row with one value per excitation frequency
+        self.k2coef_pm2 = np.ascontiguousarray(-np.transpose(kBlw_pm**2) * (n+1) / (2*n+1) / n)
+        self.Qoffset = n / (n+1)
+        self.rCoef = -(2*n+1)
+
+    def fn_k2coef(self, r_m):
+        # Get the layer index of the next boundary above r_m
+        iNextAbove = np.minimum(np.searchsorted(self.rBds_m, r_m, side='left'), self.iTop)
+        return self.k2coef_pm2[iNextAbove]
 
     def __call__(self, r, Q):
-        k = self.fn_k(r)
-        return -k**2 * r * (self.n+1) / (2*self.n+1) / self.n * (Q - self.n/(self.n+1))**2 - (2*self.n+1) / r * Q
+        QminusOffset = Q - self.Qoffset
+        return self.fn_k2coef(r) * r * QminusOffset * QminusOffset + self.rCoef / r * Q
 
 
 def SetupInduction(Planet, Params):
@@ -373,8 +600,8 @@ def SetupInduction(Planet, Params):
                 zIonos_m = []
                 sigmaIonos_Sm = []
             else:
-                zIonos_m = Planet.Bulk.R_m + np.array(Planet.Magnetic.ionosBounds_m)
-                sigmaIonos_Sm = np.array(Planet.Magnetic.sigmaIonosPedersen_Sm)
+                zIonos_m = Planet.Bulk.R_m + Planet.Magnetic.ionosBounds_m
+                sigmaIonos_Sm = Planet.Magnetic.sigmaIonosPedersen_Sm
                 # Allow special case for specifying an ionosphere with 1 conductivity and 2 bounds, when
                 # there is a substantial neutral atmosphere and the conducting region is at altitude
                 # (e.g. for Triton)
@@ -382,7 +609,11 @@ def SetupInduction(Planet, Params):
                     sigmaIonos_Sm = np.append(0, sigmaIonos_Sm)
             # Flip arrays to be in radial ascending order as needed in induction calculations, then add ionosphere
             rLayers_m = np.append(np.flip(Planet.r_m[:-1]), zIonos_m)
-            sigmaInduct_Sm = np.append(np.flip(Planet.sigma_Sm), sigmaIonos_Sm)
+            if Planet.Do.IONOS_ONLY:
+                # Ignore conducting layers within the body, which then merge into a single low-conductivity layer below
+                sigmaInduct_Sm = np.append(np.full(np.size(Planet.sigma_Sm), Constants.sigmaDef_Sm), sigmaIonos_Sm)
+            else:
+                sigmaInduct_Sm = np.append(np.flip(Planet.sigma_Sm), sigmaIonos_Sm)
 
             # Eliminate NaN values and 0 values, assigning them to a default minimum
             sigmaInduct_Sm[np.logical_or(np.isnan(sigmaInduct_Sm), sigmaInduct_Sm == 0)] = Constants.sigmaDef_Sm
@@ -390,7 +621,7 @@ def SetupInduction(Planet, Params):
             sigmaInduct_Sm[sigmaInduct_Sm < Constants.sigmaMin_Sm] = Constants.sigmaDef_Sm
 
             # Optionally, further reduce computational overhead by shrinking the number of ocean layers modeled
-            if Params.Sig.REDUCED_INDUCT:
+            if Params.Sig.REDUCED_INDUCT and not Planet.Do.IONOS_ONLY:
                 indsLiq = np.where(np.flip(Planet.phase) == 0)[0]
                 if np.size(indsLiq) > 0 and not np.all(np.diff(indsLiq) == 1):
                     log.warning('HP ices found in ocean while REDUCED_INDUCT is True. They will be ignored ' +
@@ -410,7 +641,7 @@ def SetupInduction(Planet, Params):
                     sigmaInduct_Sm = np.concatenate((sigmaInduct_Sm[:indsLiq[0]], sigmaOcean_Sm, sigmaInduct_Sm[indsLiq[-1]+1:]))
 
             # Get the indices of layers just below where changes happen
-            iChange = [i for i,sig in enumerate(sigmaInduct_Sm) if sig != np.append(sigmaInduct_Sm, np.nan)[i+1]]
+            iChange = np.append(np.flatnonzero(np.diff(sigmaInduct_Sm) != 0), np.size(sigmaInduct_Sm) - 1)
             Planet.Magnetic.sigmaLayers_Sm = sigmaInduct_Sm[iChange]
             Planet.Magnetic.rSigChange_m = rLayers_m[iChange]
 
@@ -437,15 +668,14 @@ def SetupInduction(Planet, Params):
                 Planet.Magnetic.nAsymBds = np.size(Planet.Magnetic.zMeanAsym_km)
 
                 # Fetch Xid array
-                XidLabel = f''
-                if XidLabel not in EOSlist.loaded.keys():
-                    nMax = Planet.Magnetic.nprmMax + Planet.Magnetic.pMax
+                nMax = Planet.Magnetic.nprmMax + Planet.Magnetic.pMax
+                XidLabel = f'Xid_{Planet.Magnetic.nprmMax}_{Planet.Magnetic.pMax}_{nMax}'
+                Planet.Magnetic.Xid = EOSlist.loaded.get(XidLabel)
+                if Planet.Magnetic.Xid is None:
                     Planet.Magnetic.Xid = LoadXid(Planet.Magnetic.nprmMax, Planet.Magnetic.pMax, nMax,
                                   Planet.Magnetic.nLin, Planet.Magnetic.mLin, reload=True, do_parallel=False)
                     EOSlist.loaded[XidLabel] = Planet.Magnetic.Xid
                     EOSlist.ranges[XidLabel] = f'{Planet.Magnetic.nprmMax}x{Planet.Magnetic.pMax}x{nMax}'
-                else:
-                    Planet.Magnetic.Xid = EOSlist.loaded[XidLabel]
         else:
             Planet.Magnetic.pMax = 0
             Planet.Magnetic.asymShape_m = np.zeros((Planet.Magnetic.nBds, 2, 1, 1))
@@ -458,7 +688,7 @@ def SetupInduction(Planet, Params):
 
         # Initialize Binm array to have the same shape and data type as Benm
         if Planet.Magnetic.Binm_nT is None: 
-            Planet.Magnetic.Binm_nT = np.zeros_like(Planet.Magnetic.Benm_nT)
+            Planet.Magnetic.Binm_nT = np.zeros_like(Planet.Magnetic.Benm_nT, dtype=Params.Induct.BinmDtype)
 
     else:
         # Make sure explore-o-grams play nice when ionosphere properties are not set
@@ -502,9 +732,10 @@ def GetBexc(bodyname, era, model, excSelection, nprmMax=1, pMax=0):
     """
     BeLabel = f'{bodyname}Be{nprmMax}{era}{model}{excSelection}'
 
-    if BeLabel in EOSlist.loaded.keys():
+    BeLoaded = EOSlist.loaded.get(BeLabel)
+    if BeLoaded is not None:
         log.debug(f'{bodyname} excitation spectrum for {model} model and {era} era already loaded. Reusing existing.')
-        Texc_hr, omegaExc_radps, Benm_nT, B0_nT = EOSlist.loaded[BeLabel]
+        Texc_hr, omegaExc_radps, Benm_nT, B0_nT = BeLoaded
     else:
         if bodyname[:4] == 'Test':
             fNames = [f'Be{npi}xyz_Test' for npi in range(1, nprmMax+1)]
@@ -524,21 +755,15 @@ def GetBexc(bodyname, era, model, excSelection, nprmMax=1, pMax=0):
 
         if os.path.isfile(os.path.join(fPath, f'{fNames[0]}.txt')):
             inpTexc_hr, inpBenm_nT, B0_nT = GetBenm(nprmMax, pMax, fpath=fPath, fName=fNames[0])
-            BeList = Excitations(bodyname)
-            eachT = np.logical_and([excSelection[key] for key in BeList.keys()], [BeList[key] is not None for key in BeList.keys()])
-            nPeaks = sum(eachT)
-            Texc_hr = np.zeros(nPeaks)
-            Benm_nT = np.zeros((nPeaks, 2, nprmMax+pMax+1, nprmMax+pMax+1), dtype=np.complex_)
+            BeList = ExcitationsCached(bodyname)
             # Include in the excitation spectrum only the periods specified in configPPinduct.py
-            iPeak = 0
-            for oscillation, included in excSelection.items():
-                if included and BeList[oscillation] is not None:
-                    iClosest = np.argmin(abs(inpTexc_hr - BeList[oscillation]))
-                    Texc_hr[iPeak] = inpTexc_hr[iClosest]
-                    Benm_nT[iPeak, ...] = inpBenm_nT[inpTexc_hr == Texc_hr[iPeak], ...]
-                    iPeak += 1
+            targets_hr = np.array([BeList[oscillation] for oscillation, included in excSelection.items()
+                                   if included and BeList[oscillation] is not None], dtype=np.float_)
+            iClosest = np.abs(inpTexc_hr[:, np.newaxis] - targets_hr[np.newaxis, :]).argmin(axis=0)
+            Texc_hr = inpTexc_hr[iClosest]
+            Benm_nT = inpBenm_nT[iClosest, ...]
 
-            omegaExc_radps = 2*np.pi / Texc_hr / 3600
+            omegaExc_radps = TWOPI_PER_HR * np.reciprocal(Texc_hr)
 
             EOSlist.loaded[BeLabel] = (Texc_hr, omegaExc_radps, Benm_nT, B0_nT)
             EOSlist.ranges[BeLabel] = Texc_hr
@@ -550,11 +775,28 @@ def GetBexc(bodyname, era, model, excSelection, nprmMax=1, pMax=0):
     return Texc_hr, omegaExc_radps, Benm_nT, B0_nT
 
 
+@lru_cache(maxsize=None)
+def ExcitationsCached(bodyname):
+    """ Look up the major excitation periods for a body once per body name.
+
+        Args:
+            bodyname (str): Body name.
+        Returns:
+            Texc_hr (dict): Approximate periods in hr for each named excitation,
+                as in ExcitationsList.
+    """
+    return Excitations(bodyname)
+
+
 def Benm2absBexyz(Benm):
-    A1 = np.sqrt(2*np.pi/3)
-    Bex = np.abs(-1 /2/A1 * (Benm[:,1,1,1] - Benm[:,0,1,1]))
-    Bey = np.abs( 1j/2/A1 * (Benm[:,1,1,1] + Benm[:,0,1,1]))
-    Bez = np.abs(-1 /np.sqrt(2)/A1 * Benm[:,0,1,0])
+    # The unit-modulus prefactors (-1, 1j) drop out of the absolute values, so only
+    # the real scale factors are applied after taking the modulus.
+    halfInvA1 = 0.5 / np.sqrt(2*np.pi/3)
+    B11p = Benm[:,0,1,1]
+    B11m = Benm[:,1,1,1]
+    Bex = halfInvA1 * np.abs(B11m - B11p)
+    Bey = halfInvA1 * np.abs(B11m + B11p)
+    Bez = np.sqrt(2)*halfInvA1 * np.abs(Benm[:,0,1,0])
     return Bex, Bey, Bez
 
 
@@ -617,10 +859,10 @@ def SetGravShape(Planet, Params):
     # These are the UNNORMALIZED deformation terms. They are incorrectly labeled as Schmidt semi-
     # normalized coefficients in Styczinski et al. (2021). To get the 4π-normalized terms we need to use
     # calculations from MoonMag from the unnormalized ones, we need to divide by the 4π-normalization factor:
-    H2c_4pi_m = [H2c_m[q] / normFactor_4pi(p, q) for q in range(p+1)]
-    H2s_4pi_m = [H2s_m[q] / normFactor_4pi(p, q) for q in range(p+1)]
+    H2c_4pi_m = H2c_m / NORM_4PI[p]
+    H2s_4pi_m = H2s_m / NORM_4PI[p]
     # Convert to fully normalized, complex coefficients with Condon-Shortley phase
-    g_chipq_m = GeodesyNorm2chipq(p, H2c_4pi_m, H2s_4pi_m)
+    g_chipq_m = ChipqCached(p, tuple(H2c_4pi_m.tolist()), tuple(H2s_4pi_m.tolist()))
     # Construct the gravity shape array by scaling the shape to the surface radius
     radialScale = Planet.Magnetic.rSigChange_m / Planet.Bulk.R_m
     for iLayer, rScale in enumerate(radialScale):
@@ -663,14 +905,7 @@ def SetAsymShape(Planet, Params):
         fName = os.path.join(Params.DataFiles.inductPath, f'{shapeFname}.txt')
         if fName in shapeFiles:
             log.debug(f'Using asymmetric shape file, concentrically: {fName}')
-            if fName in EOSlist.loaded.keys():
-                log.debug(f'Already loaded {fName}, reusing existing.')
-                Planet.Magnetic.pLin, Planet.Magnetic.qLin, Cpq_km, Spq_km = EOSlist.loaded[fName]
-            else:
-                Planet.Magnetic.pLin, Planet.Magnetic.qLin, Cpq_km, Spq_km, _, _ \
-                    = np.loadtxt(fName, skiprows=1, unpack=True, delimiter=',')
-                EOSlist.loaded[fName] = (Planet.Magnetic.pLin, Planet.Magnetic.qLin, Cpq_km, Spq_km)
-                EOSlist.ranges[fName] = ''
+            Planet.Magnetic.pLin, Planet.Magnetic.qLin, Cpq_km, Spq_km, _ = LoadAsymShapeFile(fName)
 
             if not (Planet.Magnetic.pLin[0] == 0 and Planet.Magnetic.qLin[0] == 0):
                 raise RuntimeError(f'Shape file {fName} does not start at p,q = [0,0].')
@@ -682,8 +917,9 @@ def SetAsymShape(Planet, Params):
                 Planet.Magnetic.pMax = int(np.max(Planet.Magnetic.pLin))
             # Initialize the asymShape array
             Planet.Magnetic.asymShape_m = np.zeros((Planet.Magnetic.nBds, 2, Planet.Magnetic.pMax+1, Planet.Magnetic.pMax+1),
-                                                 dtype=np.complex_)
+                                                 dtype=Params.Induct.asymShapeDtype)
             
+            Planet.Magnetic.asymShape_m[:, 0, 0, 0] = Planet.Magnetic.rSigChange_m
             # Convert 4π-normalized depth coefficients in km to fully normalized radial and in m
             for p in range(1, Planet.Magnetic.pMax+1):
                 iMin = int(p * (p+1) / 2)
@@ -691,11 +927,9 @@ def SetAsymShape(Planet, Params):
                 # Negate to convert from deviations of depth to radius
                 Cpq_m = -Cpq_km[iMin:iMax] * 1e3
                 Spq_m = -Spq_km[iMin:iMax] * 1e3
-                chipq_m = GeodesyNorm2chipq(p, Cpq_m, Spq_m)
-                # Scale according to radius and fill into asymShape
-                for iLayer, rScale in enumerate(radialScale):
-                    Planet.Magnetic.asymShape_m[iLayer, 0, 0, 0] = Planet.Magnetic.rSigChange_m[iLayer]
-                    Planet.Magnetic.asymShape_m[iLayer, :, p, :p+1] = chipq_m * rScale
+                chipq_m = ChipqCached(p, tuple(Cpq_m.tolist()), tuple(Spq_m.tolist()))
+                # Scale according to radius and fill into asymShape for all boundaries at once
+                Planet.Magnetic.asymShape_m[:, :, p, :p+1] = chipq_m[np.newaxis, ...] * radialScale[:, np.newaxis, np.newaxis]
 
             Planet.Magnetic.zMeanAsym_km = np.append(Planet.Magnetic.zMeanAsym_km, Cpq_km[0])
             Planet.Magnetic.iAsymBds = np.append(Planet.Magnetic.iAsymBds, 
@@ -707,32 +941,33 @@ def SetAsymShape(Planet, Params):
         # Here, we load as many files as are present and add them to the nearest-depth boundary.
         log.debug(f'Using asymmetric shape file(s):\n  ' + ',\n  '.join(shapeFiles))
         pLin, qLin, Cpq_km, Spq_km = (np.empty(np.size(shapeFiles), dtype=object) for _ in range(4))
+        pMaxNonzero = np.zeros(np.size(shapeFiles), dtype=np.int_)
         for i, fName in enumerate(shapeFiles):
-            if fName in EOSlist.loaded.keys():
-                log.debug(f'Already loaded {fName}, reusing existing.')
-                pLin[i], qLin[i], Cpq_km[i], Spq_km[i] = EOSlist.loaded[fName]
-            else:
-                pLin[i], qLin[i], Cpq_km[i], Spq_km[i], _, _ \
-                    = np.loadtxt(fName, skiprows=1, unpack=True, delimiter=',')
-                EOSlist.loaded[fName] = (pLin[i], qLin[i], Cpq_km[i], Spq_km[i])
-                EOSlist.ranges[fName] = ''
-        
+            pLin[i], qLin[i], Cpq_km[i], Spq_km[i], pMaxNonzero[i] = LoadAsymShapeFile(fName)
+
         # Limit Magnetic.pMax to the values we now have
-        pMaxNonzero = int(np.max([np.max(pL[np.logical_or(Cpq_km[i] != 0, Spq_km[i] != 0)]) for i, pL in enumerate(pLin)]))
-        if Planet.Magnetic.pMax is None or Planet.Magnetic.pMax > pMaxNonZero:
-            Planet.Magnetic.pMax = pMaxNonzero
+        if Planet.Magnetic.pMax is None or Planet.Magnetic.pMax > np.max(pMaxNonzero):
+            Planet.Magnetic.pMax = int(np.max(pMaxNonzero))
         # Initialize the shape array
         Planet.Magnetic.asymShape_m = np.zeros((Planet.Magnetic.nBds, 2, Planet.Magnetic.pMax+1, Planet.Magnetic.pMax+1),
-                                                 dtype=np.complex_)
-
+                                                 dtype=Params.Induct.asymShapeDtype)
+
+        # Find the nearest boundary to each file's mean radius. rSigChange_m is sorted
+        # in ascending order, so we only need to compare the two bracketing boundaries.
+        rAsymAll_m = Planet.Bulk.R_m - np.array([Cpq[0] for Cpq in Cpq_km]) * 1e3
+        iAbove = np.minimum(np.searchsorted(Planet.Magnetic.rSigChange_m, rAsymAll_m), Planet.Magnetic.nBds - 1)
+        iBelow = np.maximum(iAbove - 1, 0)
+        iLayerAll = np.where(np.abs(Planet.Magnetic.rSigChange_m[iAbove] - rAsymAll_m)
+                             < np.abs(Planet.Magnetic.rSigChange_m[iBelow] - rAsymAll_m), iAbove, iBelow)
+
+        zMeanAsym_km = [Planet.Magnetic.zMeanAsym_km]
+        iAsymBds = [Planet.Magnetic.iAsymBds]
         for i, fName in enumerate(shapeFiles):
-            pMaxNonzero = np.max(pLin[i][np.logical_or(Cpq_km[i] != 0, Spq_km[i] != 0)])
-            pMax = int(np.minimum(pMaxNonzero, Planet.Magnetic.pMax))
+            pMax = int(np.minimum(pMaxNonzero[i], Planet.Magnetic.pMax))
             if not (pLin[i][0] == 0 and qLin[i][0] == 0):
                 raise RuntimeError(f'Shape file {fName} does not start at p,q = [0,0].')
-            rAsym_m = Planet.Bulk.R_m - Cpq_km[i][0] * 1e3
-            radDiff = Planet.Magnetic.rSigChange_m - rAsym_m
-            iLayer = np.argmin(abs(radDiff))
+            rAsym_m = rAsymAll_m[i]
+            iLayer = iLayerAll[i]
             # Convert 4π-normalized depth coefficients in km to fully normalized radial and in m
             Planet.Magnetic.asymShape_m[iLayer, 0, 0, 0] = Planet.Magnetic.rSigChange_m[iLayer]
             for p in range(1, pMax+1):
@@ -741,30 +976,78 @@ def SetAsymShape(Planet, Params):
                 # Negate to convert from deviations of depth to radius
                 Cpq_m = -Cpq_km[i][iMin:iMax] * 1e3
                 Spq_m = -Spq_km[i][iMin:iMax] * 1e3
-                chipq_m = GeodesyNorm2chipq(p, Cpq_m, Spq_m)
+                chipq_m = ChipqCached(p, tuple(Cpq_m.tolist()), tuple(Spq_m.tolist()))
                 # Scale according to radius and fill into asymShape
                 Planet.Magnetic.asymShape_m[iLayer, :, p, :p+1] = Planet.Magnetic.asymShape_m[iLayer, :, p, :p+1] \
                         + chipq_m * rAsym_m / Planet.Magnetic.rSigChange_m[iLayer]
 
-                Planet.Magnetic.zMeanAsym_km = np.append(Planet.Magnetic.zMeanAsym_km, np.real(Planet.Bulk.R_m - Planet.Magnetic.asymShape_m[iLayer, 0, 0, 0])/1e3)
-                Planet.Magnetic.iAsymBds = np.append(Planet.Magnetic.iAsymBds, iLayer)
+                zMeanAsym_km.append(np.real(Planet.Bulk.R_m - Planet.Magnetic.asymShape_m[iLayer, 0, 0, 0])/1e3)
+                iAsymBds.append(iLayer)
+
+        Planet.Magnetic.zMeanAsym_km = np.concatenate([np.atleast_1d(z_km) for z_km in zMeanAsym_km])
+        Planet.Magnetic.iAsymBds = np.concatenate([np.atleast_1d(iBd) for iBd in iAsymBds]).astype(np.int_)
 
     if SKIP_ASYM:
         log.warning(reason + ' Asymmetry will be modeled only for the gravity coefficients.')
         Planet.Magnetic.pMax = 2
         Planet.Magnetic.asymShape_m = np.zeros((Planet.Magnetic.nBds, 2, Planet.Magnetic.pMax+1, Planet.Magnetic.pMax+1),
-                                             dtype=np.complex_)
+                                             dtype=Params.Induct.asymShapeDtype)
     else:
         Planet.Magnetic.zMeanAsym_km = np.unique(Planet.Magnetic.zMeanAsym_km)
         Planet.Magnetic.iAsymBds = np.unique(Planet.Magnetic.iAsymBds)
 
     if Planet.Magnetic.pLin is None:
-        Planet.Magnetic.pLin = [p for p in range(1, Planet.Magnetic.pMax+1) for _ in range(-p, p+1)]
-        Planet.Magnetic.qLin = [q for p in range(1, Planet.Magnetic.pMax+1) for q in range(-p, p+1)]
+        pList = np.arange(1, Planet.Magnetic.pMax+1, dtype=np.int_)
+        Planet.Magnetic.pLin = np.repeat(pList, 2*pList + 1)
+        # Each p block starts at linear index p**2 - 1 and runs over q = -p to p
+        Planet.Magnetic.qLin = np.arange(np.size(Planet.Magnetic.pLin), dtype=np.int_) - (Planet.Magnetic.pLin**2 - 1) - Planet.Magnetic.pLin
 
     return Planet
 
 
+def LoadAsymShapeFile(fName):
+    """ Read an asymmetric shape file from disk, or reuse the contents if it has
+        already been loaded and has not been modified since.
+
+        Args:
+            fName (str): Path to shape file with 4π-normalized depth coefficients.
+        Returns:
+            pLin, qLin (float, shape N): Degree and order of each coefficient.
+            Cpq_km, Spq_km (float, shape N): Cosine and sine depth coefficients in km.
+            pMaxNonzero (int): Maximum p value with a nonzero coefficient.
+    """
+    shapeLabel = f'{fName}{os.path.getmtime(fName)}'
+    shapeData = EOSlist.loaded.get(shapeLabel)
+    if shapeData is not None:
+        log.debug(f'Already loaded {fName}, reusing existing.')
+    else:
+        pLin, qLin, Cpq_km, Spq_km, _, _ = np.loadtxt(fName, skiprows=1, unpack=True, delimiter=',')
+        pMaxNonzero = int(np.max(pLin[np.logical_or(Cpq_km != 0, Spq_km != 0)], initial=0))
+        shapeData = (pLin, qLin, Cpq_km, Spq_km, pMaxNonzero)
+        EOSlist.loaded[shapeLabel] = shapeData
+        EOSlist.ranges[shapeLabel] = ''
+
+    return shapeData
+
+
+@lru_cache(maxsize=4096)
+def ChipqCached(p, Cpq_m, Spq_m):
+    """ Convert 4π-normalized shape coefficients for a single degree p to fully
+        normalized chi_pq, reusing the result for repeated coefficient sets.
+
+        Args:
+            p (int): Degree of the shape coefficients.
+            Cpq_m, Spq_m (tuple of float, length p+1): Cosine and sine coefficients
+                for q = 0 to p.
+        Returns:
+            chipq_m (complex, shape 2 x p+1): Read-only chi_pq values, as returned by
+                MoonMag get_chipq_from_CSpq.
+    """
+    chipq_m = GeodesyNorm2chipq(p, np.array(Cpq_m), np.array(Spq_m))
+    chipq_m.flags.writeable = False
+    return chipq_m
+
+
 def normFactor_4pi(n, m):
     """ Calculate the normalization factor for 4π-normalized spherical harmonics,
         without the Condon-Shortley phase, as needed for shape calculations that make
@@ -773,6 +1056,10 @@ def normFactor_4pi(n, m):
     return np.sqrt((2*n+1) * sps.factorial(n - abs(m)) / sps.factorial(n + abs(m)))
 
 
+# 4π normalization factors for q = 0 to p, precomputed for the gravity shape degrees
+NORM_4PI = {p: normFactor_4pi(p, np.arange(p+1)) for p in range(1, 5)}
+
+
 def FourierSpectrum(Planet, Params):
     """ Load a Fourier spectrum of magnetic excitations applied to the body,
         calculate the spherically symmetric induction amplitude across this
@@ -790,20 +1077,47 @@ def FourierSpectrum(Planet, Params):
             # amplitudes to save on computation time (behavior will be smooth, we'll interpolate)
             TexcReduced_hr = np.geomspace(np.min(Planet.Magnetic.TexcFT_hr), np.max(Planet.Magnetic.TexcFT_hr),
                                           Params.MagSpectrum.nOmegaPts)
-            omegaReduced_radps = 2 * np.pi / TexcReduced_hr / 3600
-            # Evaluate complex amplitudes
-            Ae1FTreduced, _, _ \
-                = AeList(Planet.Magnetic.rSigChange_m, Planet.Magnetic.sigmaLayers_Sm,
-                         omegaReduced_radps, 1/Planet.Bulk.R_m, nn=1,
-                         writeout=False, do_parallel=Params.DO_PARALLEL)
-
-            # Interpolate to full excitation spectrum
-            Planet.Magnetic.Ae1FT = spi.interp1d(TexcReduced_hr, Ae1FTreduced, kind=Params.MagSpectrum.interpMethod
-                                                 )(Planet.Magnetic.TexcFT_hr)
+            omegaReduced_radps = TWOPI_PER_HR * np.reciprocal(TexcReduced_hr)
+            # Evaluate complex amplitudes. Frequencies are independent, so we split them into
+            # one contiguous block per process rather than dispatching each frequency separately.
+            if Params.DO_PARALLEL and not (Params.INDUCTOGRAM_IN_PROGRESS or Params.DO_EXPLOREOGRAM):
+                nCores = np.min([Params.maxCores, np.size(omegaReduced_radps), Params.threadLimit])
+            else:
+                nCores = 1
+            if nCores > 1:
+                pool = mtpFork.Pool(nCores)
+                parResult = [pool.apply_async(AeList, (Planet.Magnetic.rSigChange_m, Planet.Magnetic.sigmaLayers_Sm,
+                                                       omegaBlock_radps, 1/Planet.Bulk.R_m),
+                                              {'nn': 1, 'writeout': False, 'do_parallel': False})
+                             for omegaBlock_radps in np.array_split(omegaReduced_radps, nCores)]
+                pool.close()
+                pool.join()
+                Ae1FTreduced = np.concatenate([result.get()[0] for result in parResult])
+            else:
+                Ae1FTreduced, _, _ \
+                    = AeList(Planet.Magnetic.rSigChange_m, Planet.Magnetic.sigmaLayers_Sm,
+                             omegaReduced_radps, 1/Planet.Bulk.R_m, nn=1,
+                             writeout=False, do_parallel=False)
+
+            # Interpolate to full excitation spectrum, using the dedicated routines where available
+            interpMethod = Params.MagSpectrum.interpMethod
+            if interpMethod == 'linear':
+                Planet.Magnetic.Ae1FT = np.interp(Planet.Magnetic.TexcFT_hr, TexcReduced_hr, Ae1FTreduced)
+            elif interpMethod == 'cubic':
+                # Same not-a-knot spline as interp1d with kind='cubic'
+                Planet.Magnetic.Ae1FT = spi.CubicSpline(TexcReduced_hr, Ae1FTreduced)(Planet.Magnetic.TexcFT_hr)
+            elif interpMethod == 'pchip':
+                # PCHIP only accepts real values, so interpolate real and imaginary parts separately
+                Planet.Magnetic.Ae1FT = spi.PchipInterpolator(TexcReduced_hr, np.real(Ae1FTreduced))(Planet.Magnetic.TexcFT_hr) \
+                                   + 1j * spi.PchipInterpolator(TexcReduced_hr, np.imag(Ae1FTreduced))(Planet.Magnetic.TexcFT_hr)
+            else:
+                Planet.Magnetic.Ae1FT = spi.interp1d(TexcReduced_hr, Ae1FTreduced, kind=interpMethod
+                                                     )(Planet.Magnetic.TexcFT_hr)
 
             # Get complex induced dipole components
-            Planet.Magnetic.Bi1xyzFT_nT = {vComp: Planet.Magnetic.Be1xyzFT_nT[vComp] * Planet.Magnetic.Ae1FT
-                                           for vComp in ['x', 'y', 'z']}
+            Bi1xyzFT_nT = np.stack([Planet.Magnetic.Be1xyzFT_nT[vComp] for vComp in ['x', 'y', 'z']]) \
+                          * Planet.Magnetic.Ae1FT[np.newaxis, :]
+            Planet.Magnetic.Bi1xyzFT_nT = {vComp: Bi1xyzFT_nT[i, :] for i, vComp in enumerate(['x', 'y', 'z'])}
             
             if not Params.NO_SAVEFILE:
                 # Save to disk
@@ -831,7 +1145,7 @@ def LoadFTdata(Planet, Params):
         BeFTdataPath = os.path.join(_Defaults, Planet.bodyname, Params.DataFiles.BeFTdata)
 
     if os.path.isfile(BeFTdataPath):
-        BeFTdata = loadmat(BeFTdataPath)
+        BeFTdata = LoadmatCached(BeFTdataPath)
         Planet.Magnetic.TexcFT_hr = BeFTdata['T_h'][0]
         Planet.Magnetic.TmaxFT_hr = BeFTdata['Tmax'][0,0]
         Planet.Magnetic.extModelFT = BeFTdata['magModelDescrip'][0]
@@ -855,7 +1169,7 @@ def ReloadSpectrum(Planet, Params):
     """ Reload Fourier spectrum calculations from disk """
 
     if os.path.isfile(Params.DataFiles.FTdata):
-        FTdata = loadmat(Params.DataFiles.FTdata)
+        FTdata = LoadmatCached(Params.DataFiles.FTdata)
         Planet.Magnetic.Ae1FT = FTdata['Ae1FT'][0]
         Planet.Magnetic.Bi1xyzFT_nT = {
             'x': FTdata['Bi1x_nT'][0],
@@ -874,14 +1188,19 @@ def ReloadSpectrum(Planet, Params):
 
 
 def FindBindCA(Planet, Params, scName, tStrList):
-    """ Get induced magnetic field vector at a list of closest approach times
-        for the named spacecraft.
+    """ Find the actual closest approach times for the named spacecraft near each
+        time in tStrList. Closest approach times and distances are stored in
+        Planet.Magnetic.etCA and Planet.Magnetic.rCA_km.
     """
-    etCAapprox = spice.str2et(tStrList)
-    etCA = np.zeros_like(etCAapprox)
-    for i, etCAnamed in enumerate(etCAapprox):
-        etSearch = np.arange(etCAnamed-Params.tRangeCA_s, etCAnamed+Params.tRangeCA_s, Params.tSearchRes_s)
-        _, _, _, rRange_km = BodyDist_km(scName, Planet.bodyname, etSearch)
-        etCA[i] = etSearch[np.argmin(rRange_km)]
+    etCAapprox = np.atleast_1d(spice.str2et(tStrList))
+    # Search the same time window around each approximate CA with a single distance query
+    etWindow = np.arange(-Params.tRangeCA_s, Params.tRangeCA_s, Params.tSearchRes_s)
+    etSearch = etCAapprox[:, np.newaxis] + etWindow[np.newaxis, :]
+    _, _, _, rRange_km = BodyDist_km(scName, Planet.bodyname, etSearch.flatten())
+    rRange_km = np.reshape(rRange_km, etSearch.shape)
+    iCA = np.argmin(rRange_km, axis=1)
+    iNamed = np.arange(np.size(etCAapprox))
+    Planet.Magnetic.etCA = etSearch[iNamed, iCA]
+    Planet.Magnetic.rCA_km = rRange_km[iNamed, iCA]
 
     return Planet
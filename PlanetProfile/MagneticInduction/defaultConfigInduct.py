@@ -3,7 +3,7 @@ import numpy as np
 from PlanetProfile.Utilities.defineStructs import InductOgramParamsStruct, \
     ExcitationSpectrumParamsStruct, ConductLayerParamsStruct, Constants
 
-configInductVersion = 2  # Integer number for config file version. Increment when new settings are added to the default config file.
+configInductVersion = 4  # Integer number for config file version. Increment when new settings are added to the default config file.
 inductOtype = 'rho'  # Type of inductogram plot to make. Options are "Tb", "phi", "rho", "sigma", where the first 3 are vs. salinity, and sigma is vs. thickness. Sigma/D plot is not self-consistent.
 testBody = 'Europa'  # Assign test profiles to use excitation moments for this body
 dftC = 5  # Default number of contours to include in induct-o-grams
@@ -26,7 +26,7 @@ def GetInductParams(inductOtype, cLevels, dftC, cFmt):
 
     # Excitation spectrum settings
     ExcSpecParams.nOmegaPts = 100  # Resolution in log frequency space for magnetic excitation spectra
-    ExcSpecParams.interpMethod = 'cubic'  # Interpolation method for complex response amplitudes in Fourier spectrum
+    ExcSpecParams.interpMethod = 'cubic'  # Interpolation method for complex response amplitudes in Fourier spectrum. Options are 'linear', 'cubic', 'pchip', or any other kind accepted by scipy.interpolate.interp1d.
     ExcSpecParams.Tmin_hr = 1  # Cutoff period to limit range of Fourier space shown
 
     # Inductogram calculation and plot settings
@@ -53,10 +53,13 @@ def GetInductParams(inductOtype, cLevels, dftC, cFmt):
     InductParams.Dmin = {'Europa': np.log10(1e0)}
     InductParams.Dmax = {'Europa': np.log10(2e2)}
     InductParams.zbFixed_km = {'Europa': 20}
-    InductParams.EckhardtSolveMethod = 'RK45'  # Numerical solution method for scipy.integrate.solve_ivp. See https://docs.scipy.org/doc/scipy/reference/generated/scipy.integrate.solve_ivp.html
+    InductParams.EckhardtSolveMethod = 'dop853'  # Numerical solution method. Lowercase integrator names for scipy.integrate.ode ('dop853', 'dopri5', 'lsoda', 'vode', 'zvode') are fastest; other options are passed to scipy.integrate.solve_ivp. See https://docs.scipy.org/doc/scipy/reference/generated/scipy.integrate.ode.html and https://docs.scipy.org/doc/scipy/reference/generated/scipy.integrate.solve_ivp.html
     InductParams.rMinODE = 1e3  # Minimum radius to use for numerical solution. Cannot be zero because of singularity at the origin.
     InductParams.oceanInterpMethod = 'linear'  # Interpolation method for determining ocean conductivities when REDUCED_INDUCT is True.
     InductParams.nIntL = 5  # Number of ocean layers to use when REDUCED_INDUCT = 1
+    InductParams.SAVE_NPZ = False  # Whether to save induced moments as uncompressed .npz files instead of .mat, for faster disk access in large sweeps. .mat files can also be read in Matlab.
+    InductParams.BinmDtype = np.complex64  # Data type for storing induced moments Binm_nT and BinmLin_nT. complex64 halves memory use in large sweeps; set to np.complex_ for full double precision. Response amplitudes Aen are always double precision.
+    InductParams.asymShapeDtype = np.complex64  # Data type for asymmetric and gravity shape coefficients asymShape_m and gravShape_m. complex64 halves memory use; set to np.complex_ for full double precision, e.g. for validation.
 
     return SigParams, ExcSpecParams, InductParams
 
@@ -12,7 +12,8 @@ from glob import glob as FilesMatchingPattern
 # Import all function definitions for this file
 from PlanetProfile import _Defaults, _TestImport, CopyCarefully
 from PlanetProfile.GetConfig import Params as configParams, FigMisc
-from PlanetProfile.MagneticInduction.MagneticInduction import MagneticInduction, ReloadInduction, Benm2absBexyz
+from PlanetProfile.MagneticInduction.MagneticInduction import MagneticInduction, ReloadInduction, Benm2absBexyz, \
+    WriteInductOgramMoments
 from PlanetProfile.MagneticInduction.Moments import InductionResults, Excitations as Mag
 from PlanetProfile.Plotting.ProfilePlots import GeneratePlots, GenerateMagPlots, \
     PlotInductOgram, PlotInductOgramPhaseSpace, PlotExploreOgram
@@ -469,44 +470,23 @@ def WriteProfile(Planet, Params):
         f.write(Planet.label + '\n')
         f.write('\n  '.join(headerLines) + '\n')
         f.write(' '.join(colHeaders) + '\n')
-        # Now print the columnar data
-        for i in range(Planet.Steps.nTotal):
-            f.write(' '.join([
-                f'{Planet.P_MPa[i]:24.17e}',
-                f'{Planet.T_K[i]:24.17e}',
-                f'{Planet.r_m[i]:24.17e}',
-                f'{Planet.phase[i]:8d}',
-                f'{Planet.rho_kgm3[i]:24.17e}',
-                f'{Planet.Cp_JkgK[i]:24.17e}',
-                f'{Planet.alpha_pK[i]:24.17e}',
-                f'{Planet.g_ms2[i]:24.17e}',
-                f'{Planet.phi_frac[i]:24.17e}',
-                f'{Planet.sigma_Sm[i]:24.17e}',
-                f'{Planet.kTherm_WmK[i]:24.17e}',
-                f'{Planet.Seismic.VP_kms[i]:24.17e}',
-                f'{Planet.Seismic.VS_kms[i]:24.17e}',
-                f'{Planet.Seismic.QS[i]:24.17e}',
-                f'{Planet.Seismic.KS_GPa[i]:24.17e}',
-                f'{Planet.Seismic.GS_GPa[i]:24.17e}',
-                f'{Planet.Ppore_MPa[i]:24.17e}',
-                f'{Planet.rhoMatrix_kgm3[i]:24.17e}',
-                f'{Planet.rhoPore_kgm3[i]:24.17e}',
-                f'{Planet.MLayer_kg[i]:24.17e}',
-                f'{Planet.VLayer_m3[i]:24.17e}',
-                f'{Planet.Htidal_Wm3[i]:24.17e}']) + '\n')
+        # Now print the columnar data, gathering the layer arrays as records of a single table
+        profileCols = [Planet.P_MPa, Planet.T_K, Planet.r_m, Planet.phase, Planet.rho_kgm3, Planet.Cp_JkgK,
+                       Planet.alpha_pK, Planet.g_ms2, Planet.phi_frac, Planet.sigma_Sm, Planet.kTherm_WmK,
+                       Planet.Seismic.VP_kms, Planet.Seismic.VS_kms, Planet.Seismic.QS, Planet.Seismic.KS_GPa,
+                       Planet.Seismic.GS_GPa, Planet.Ppore_MPa, Planet.rhoMatrix_kgm3, Planet.rhoPore_kgm3,
+                       Planet.MLayer_kg, Planet.VLayer_m3, Planet.Htidal_Wm3]
+        profileTable = np.rec.fromarrays([col[:Planet.Steps.nTotal] for col in profileCols])
+        np.savetxt(f, profileTable, fmt=['%24.17e']*3 + ['%8d'] + ['%24.17e']*18, delimiter=' ', newline='\n')
 
     # Write out data from core/mantle trade
     with open(Params.DataFiles.mantCoreFile, 'w') as f:
         f.write(' '.join(['RsilTrade (m)'.ljust(24),
                           'RcoreTrade (m)'.ljust(24),
                           'rhoSilTrade (kg/m3)']) + '\n')
-        for i in range(np.size(Planet.Sil.Rtrade_m)):
-            line = ' '.join([
-                f'{Planet.Sil.Rtrade_m[i]:24.17e}',
-                f'{Planet.Core.Rtrade_m[i]:24.17e}',
-                f'{Planet.Sil.rhoTrade_kgm3[i]:24.17e}\n '
-            ])
-            f.write(line)
+        # Format the trade arrays together as columns of a single table, in the same layout as row-by-row writing
+        np.savetxt(f, np.column_stack((Planet.Sil.Rtrade_m, Planet.Core.Rtrade_m, Planet.Sil.rhoTrade_kgm3)),
+                   fmt='%24.17e', delimiter=' ', newline='\n ')
 
     log.info(f'Profile saved to file: {Params.DataFiles.saveFile}')
     return
@@ -780,6 +760,8 @@ def InductOgram(bodyname, Params):
         Params.DataFiles = DataFiles
         Params.FigureFiles = FigureFiles
         WriteInductOgram(Induction, Params)
+        if not Params.NO_SAVEFILE:
+            WriteInductOgramMoments(PlanetGrid, Params)
         Induction.SetAxes(Params.Induct.inductOtype)
         Induction.SetComps(Params.Induct.inductOtype)
     else:
@@ -26,14 +26,18 @@ def ClathProps(Plin_MPa, Tlin_K):
             alpha_pK (float, shape MxN): Thermal expansivity in 1/K for each P and T. alpha_pK = (2aT_K + b)/(aT_K^2 + bT_K + c)
             kTherm_WmK (float, shape MxN): Thermal conductivity in W/(m K) for each P and T. kTherm_WmK = c, a constant, over the specified range.
     """
-    P_MPa, T_K = np.meshgrid(Plin_MPa, Tlin_K, indexing='ij')
+    # Broadcast P down rows and T across columns instead of expanding both with meshgrid.
+    # Outputs that depend only on T are returned as read-only broadcast views.
+    P_MPa = np.asarray(Plin_MPa)[:, np.newaxis]
+    T_K = np.asarray(Tlin_K)
+    gridShape = (np.size(Plin_MPa), np.size(Tlin_K))
 
     T_C = T_K - Constants.T0
 
-    rho_kgm3 = (-2.3815e-4*T_C + 1.1843e-4*P_MPa + 0.92435) * 1e3
-    Cp_JkgK = 3.19*T_K + 2150
-    alpha_pK = (3.5697e-4*T_K + 0.2558)/(3.5697e-4*T_K**2 + 0.2558*T_K + 1612.8597)
-    kTherm_WmK = np.zeros_like(P_MPa) + 0.5
+    rho_kgm3 = (-2.3815e-4*T_C[np.newaxis, :] + 1.1843e-4*P_MPa + 0.92435) * 1e3
+    Cp_JkgK = np.broadcast_to(3.19*T_K + 2150, gridShape)
+    alpha_pK = np.broadcast_to((3.5697e-4*T_K + 0.2558)/(3.5697e-4*T_K**2 + 0.2558*T_K + 1612.8597), gridShape)
+    kTherm_WmK = np.full(gridShape, 0.5)
 
     return rho_kgm3, Cp_JkgK, alpha_pK, kTherm_WmK
 
@@ -103,12 +107,8 @@ class ClathDissoc:
         return PbClath_MPa
 
 def TclathDissocLower_K(P_MPa):
-    if isinstance(P_MPa, Iterable):
-        P_MPa[P_MPa == 0] = Constants.Pmin_MPa
-    else:
-        if P_MPa == 0:
-            P_MPa = Constants.Pmin_MPa
-    return 212.33820985 + 43.37319252 * P_MPa - 7.83348412 * P_MPa ** 2
+    # Polynomial in Horner form; no log is taken, so P = 0 needs no special handling
+    return 212.33820985 + P_MPa * (43.37319252 - 7.83348412 * P_MPa)
 def TclathDissocUpper_K(P_MPa):
     if isinstance(P_MPa, Iterable):
         P_MPa[P_MPa == 0] = Constants.Pmin_MPa
@@ -140,20 +140,12 @@ def ClathStableSloan1998(P_MPa, T_K):
                 queried to determine the phase)
     """
 
-    # Avoid log of 0 for surface pressure
-    P_MPa[P_MPa==0] = Constants.Pmin_MPa
-    # Get (P,T) pairs relevant for each portion of the dissociation curve
-    Plow_MPa, Tlow_K = np.meshgrid(P_MPa[P_MPa < 2.567], T_K, indexing='ij')
-    Pupp_MPa, Tupp_K = np.meshgrid(P_MPa[P_MPa >= 2.567], T_K, indexing='ij')
-    # Get evaluation points for lower and upper dissociation curves
-    TdissocLower_K = TclathDissocLower_K(Plow_MPa)
-    TdissocUpper_K = TclathDissocUpper_K(Pupp_MPa)
+    # Evaluate the lower or upper dissociation curve for each pressure, avoiding log of 0 for surface pressure
+    P_MPa = np.asarray(P_MPa, dtype=np.float_)
+    TdissocP_K = np.where(P_MPa < 2.567, TclathDissocLower_K(np.maximum(P_MPa, Constants.Pmin_MPa)),
+                          TclathDissocUpper_K(np.maximum(P_MPa, 2.567)))
     # Assign clathrate phase ID to (P,T) points below the dissociation curves and 0 otherwise
-    stableLow = np.zeros_like(Tlow_K).astype(np.int_)
-    stableUpp = np.zeros_like(Tupp_K).astype(np.int_)
-    stableLow[Tlow_K < TdissocLower_K] = Constants.phaseClath
-    stableUpp[Tupp_K < TdissocUpper_K] = Constants.phaseClath
-    stable = np.concatenate((stableLow, stableUpp), axis=0)
+    stable = (np.asarray(T_K)[np.newaxis, :] < TdissocP_K[:, np.newaxis]).astype(np.int_) * Constants.phaseClath
 
     return stable
 
@@ -1,6 +1,7 @@
 import numpy as np
 import logging
 from collections.abc import Iterable
+from functools import lru_cache
 from scipy.interpolate import NearestNDInterpolator, RectBivariateSpline
 from scipy.optimize import root_scalar as GetZero
 from scipy.io import loadmat
@@ -481,6 +482,23 @@ class IceSeismic:
         return seaOut.Vp * 1e-3, seaOut.Vs * 1e-3,  seaOut.Ks * 1e-3, seaOut.shear * 1e-3
 
 
+@lru_cache(maxsize=32)
+def GetPfreezeGrid(PLower_MPa, PUpper_MPa, PRes_MPa):
+    """ Returns the pressure grid spanning the range searched by GetPfreeze, for evaluating
+        melting curves. The grid is cached per (lower, upper, step) triple so that Planets
+        with the same bounds share it, so it is read-only.
+
+        Args:
+            PLower_MPa, PUpper_MPa (float): Bounds of the pressure range in MPa
+            PRes_MPa (float): Step size in pressure in MPa
+        Returns:
+            P_MPa (float, shape N): Pressures from PLower_MPa up to (excluding) PUpper_MPa
+    """
+    P_MPa = np.arange(PLower_MPa, PUpper_MPa, PRes_MPa)
+    P_MPa.flags.writeable = False
+    return P_MPa
+
+
 def GetPfreeze(oceanEOS, phaseTop, Tb_K, PLower_MPa=0, PUpper_MPa=300, PRes_MPa=0.1, UNDERPLATE=None,
                ALLOW_BROKEN_MODELS=False, DO_EXPLOREOGRAM=False):
     """ Returns the pressure at which ice changes phase based on temperature, salinity, and composition
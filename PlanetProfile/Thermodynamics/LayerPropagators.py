@@ -2,7 +2,7 @@ import numpy as np
 import logging
 
 from PlanetProfile.Thermodynamics.IronCore import IronCoreLayers
-from PlanetProfile.Thermodynamics.HydroEOS import GetPfreeze, GetTfreeze, \
+from PlanetProfile.Thermodynamics.HydroEOS import GetPfreeze, GetPfreezeGrid, GetTfreeze, \
     PhaseConv, GetPhaseIndices, GetIceEOS, GetOceanEOS
 from PlanetProfile.Thermodynamics.InnerEOS import GetHtidalFunc, GetphiCalc
 from PlanetProfile.Thermodynamics.Silicates import SilicateLayers
@@ -242,7 +242,7 @@ def IceLayers(Planet, Params):
                 Planet.Tconv_K = np.nan
                 Planet.etaConv_Pas = np.nan
             else:
-                Pbot_MPa = np.arange(Planet.PfreezeLower_MPa, Planet.PfreezeUpper_MPa, Planet.PfreezeRes_MPa)
+                Pbot_MPa = GetPfreezeGrid(Planet.PfreezeLower_MPa, Planet.PfreezeUpper_MPa, Planet.PfreezeRes_MPa)
                 Tbot_K = np.arange(Planet.T_K[Planet.Steps.nIceI], np.maximum(273, Planet.T_K[Planet.Steps.nIceI]+20), 0.5)
                 iceImeltEOS = GetOceanEOS('PureH2O', 0.0, Pbot_MPa, Tbot_K, None,
                                           phaseType=Planet.Ocean.phaseType, FORCE_NEW=True)
@@ -648,24 +648,24 @@ def InnerLayers(Planet, Params):
         Planet.Steps.nTotal = Planet.Steps.nHydro + Planet.Steps.nSil + Planet.Steps.nCore
 
         log.debug('Evaluating remaining quantities for layer arrays...')
-        # Extend Planet layer arrays to make space for silicate and possible core layers
-        extend = np.zeros(Planet.Steps.nSil + Planet.Steps.nCore)
-        Planet.P_MPa = np.concatenate((Planet.P_MPa[:Planet.Steps.nHydro], extend))
-        Planet.T_K = np.concatenate((Planet.T_K[:Planet.Steps.nHydro], extend))
-        Planet.r_m = np.concatenate((Planet.r_m[:Planet.Steps.nHydro], extend, [0.0]))
-        Planet.phase = np.concatenate((Planet.phase[:Planet.Steps.nHydro], extend.astype(np.int_)))
-        Planet.rho_kgm3 = np.concatenate((Planet.rho_kgm3[:Planet.Steps.nHydro], extend))
-        Planet.Cp_JkgK = np.concatenate((Planet.Cp_JkgK[:Planet.Steps.nHydro], extend))
-        Planet.alpha_pK = np.concatenate((Planet.alpha_pK[:Planet.Steps.nHydro], extend))
-        Planet.kTherm_WmK = np.concatenate((Planet.kTherm_WmK[:Planet.Steps.nHydro], extend))
-        Planet.g_ms2 = np.concatenate((Planet.g_ms2[:Planet.Steps.nHydro], extend))
-        Planet.phi_frac = np.concatenate((Planet.phi_frac[:Planet.Steps.nHydro], extend))
-        Planet.Htidal_Wm3 = np.concatenate((Planet.Htidal_Wm3[:Planet.Steps.nHydro], extend))
-        Planet.z_m = np.concatenate((Planet.z_m[:Planet.Steps.nHydro], extend, [0.0]))
-        Planet.Ppore_MPa = np.concatenate((Planet.Ppore_MPa[:Planet.Steps.nHydro], extend))
-        Planet.rhoMatrix_kgm3 = np.concatenate((Planet.rhoMatrix_kgm3[:Planet.Steps.nHydro], extend))
-        Planet.rhoPore_kgm3 = np.concatenate((Planet.rhoPore_kgm3[:Planet.Steps.nHydro], extend))
-        Planet.MLayer_kg = np.concatenate((Planet.MLayer_kg[:Planet.Steps.nHydro], extend))
+        # Extend Planet layer arrays to make space for silicate and possible core layers.
+        # The float arrays are allocated together as rows of one block, with hydrosphere values copied in.
+        nHydro = Planet.Steps.nHydro
+        hydroLayers = (Planet.P_MPa, Planet.T_K, Planet.rho_kgm3, Planet.Cp_JkgK, Planet.alpha_pK, Planet.kTherm_WmK,
+                       Planet.g_ms2, Planet.phi_frac, Planet.Htidal_Wm3, Planet.Ppore_MPa, Planet.rhoMatrix_kgm3,
+                       Planet.rhoPore_kgm3, Planet.MLayer_kg)
+        layers = np.zeros((len(hydroLayers), Planet.Steps.nTotal))
+        for layer, hydroLayer in zip(layers, hydroLayers):
+            layer[:nHydro] = hydroLayer[:nHydro]
+        Planet.P_MPa, Planet.T_K, Planet.rho_kgm3, Planet.Cp_JkgK, Planet.alpha_pK, Planet.kTherm_WmK, \
+            Planet.g_ms2, Planet.phi_frac, Planet.Htidal_Wm3, Planet.Ppore_MPa, Planet.rhoMatrix_kgm3, \
+            Planet.rhoPore_kgm3, Planet.MLayer_kg = layers
+        # Radius and depth have one more entry, for the center of the body
+        radii = np.zeros((2, Planet.Steps.nTotal + 1))
+        radii[0, :nHydro] = Planet.r_m[:nHydro]
+        radii[1, :nHydro] = Planet.z_m[:nHydro]
+        Planet.r_m, Planet.z_m = radii
+        Planet.phase = np.concatenate((Planet.phase[:nHydro], np.zeros(Planet.Steps.nSil + Planet.Steps.nCore, dtype=np.int_)))
 
         # Unpack results from MoI calculations
         iOS = Planet.Steps.nHydro
@@ -796,7 +796,7 @@ def CalcMoIConstantRho(Planet, Params):
     # Find contribution to axial moment of inertia C from each ocean layer
     dChydro_kgm2 = 8*np.pi/15 * Planet.rho_kgm3[:-1] * (Planet.r_m[:-1]**5 - Planet.r_m[1:]**5)
     # Find total mass contained above each hydrosphere layer
-    MAbove_kg = np.array([np.sum(Planet.MLayer_kg[:i]) for i in range(nHydroActual)])
+    MAbove_kg = np.concatenate(([0], np.cumsum(Planet.MLayer_kg[:nHydroActual-1])))
     # Find volume of a full sphere of silicate corresponding to each valid layer
     VsilSphere_m3 = 4/3*np.pi * Planet.r_m[Planet.Steps.iSilStart:]**3
 
@@ -808,9 +808,9 @@ def CalcMoIConstantRho(Planet, Params):
             # / (Planet.Core.xFeS * (Planet.Core.rhoFe_kgm3 - Planet.Core.rhoFeS_kgm3) + Planet.Core.rhoFeS_kgm3)  # Vance et al. (2014) Eq. 10
         # Calculate core volume for a silicate layer with outer radius equal to bottom of each hydrosphere layer
         # and inner radius equal to the core radius
-        VCore_m3 = np.array([(Planet.Bulk.M_kg - MAbove_kg[i] - VsilSphere_m3[i-Planet.Steps.iSilStart] *
-                             Planet.Sil.rhoSilWithCore_kgm3) / (rhoCore_kgm3 - Planet.Sil.rhoSilWithCore_kgm3)
-                             for i in range(Planet.Steps.iSilStart, nHydroActual-1)])
+        VCore_m3 = (Planet.Bulk.M_kg - MAbove_kg[Planet.Steps.iSilStart:nHydroActual-1]
+                    - VsilSphere_m3[:nHydroActual-1-Planet.Steps.iSilStart] * Planet.Sil.rhoSilWithCore_kgm3) \
+                   / (rhoCore_kgm3 - Planet.Sil.rhoSilWithCore_kgm3)
         # Find values for which the silicate radius is too large
         try:
             nTooBig = next((i[0] for i, val in np.ndenumerate(VCore_m3) if val>0))
@@ -832,8 +832,8 @@ def CalcMoIConstantRho(Planet, Params):
         rhoSil_kgm3 = np.ones_like(rCore_m) * Planet.Sil.rhoSilWithCore_kgm3
     else:
         # Find silicate density consistent with observed bulk mass for each radius
-        rhoSil_kgm3 = np.array([(Planet.Bulk.M_kg - MAbove_kg[i]) / VsilSphere_m3[i-Planet.Steps.iSilStart]
-                              for i in range(Planet.Steps.iSilStart, nHydroActual-1)])
+        rhoSil_kgm3 = (Planet.Bulk.M_kg - MAbove_kg[Planet.Steps.iSilStart:nHydroActual-1]) \
+                      / VsilSphere_m3[:nHydroActual-1-Planet.Steps.iSilStart]
         # Density of silicates is scaled to fit the total mass, so there is no nTooBig in this case.
         nTooBig = 0
         # Set core radius and density to zero so calculations can proceed
@@ -842,10 +842,10 @@ def CalcMoIConstantRho(Planet, Params):
 
     # Calculate C for a mantle extending up to each hydrosphere layer in turn
     C_kgm2 = np.zeros(nHydroActual - 1)
-    C_kgm2[Planet.Steps.iSilStart + nTooBig:] = [np.sum(dChydro_kgm2[:i + Planet.Steps.iSilStart + nTooBig + 1]) +
-            8*np.pi/15 * rhoSil_kgm3[i] * (Planet.r_m[i + Planet.Steps.iSilStart + nTooBig]**5 - rCore_m[i]**5) +
-            8*np.pi/15 * rhoCore_kgm3 * rCore_m[i]**5
-            for i in range(nHydroActual - Planet.Steps.iSilStart - nTooBig - 1)]
+    iC = Planet.Steps.iSilStart + nTooBig
+    C_kgm2[iC:] = np.cumsum(dChydro_kgm2)[iC:nHydroActual-1] + \
+            8*np.pi/15 * rhoSil_kgm3 * (Planet.r_m[iC:nHydroActual-1]**5 - rCore_m**5) + \
+            8*np.pi/15 * rhoCore_kgm3 * rCore_m**5
     CMR2 = C_kgm2 / MR2_kgm2
 
     CMR2inds = [i[0] for i, valCMR2 in np.ndenumerate(CMR2)
@@ -1,8 +1,8 @@
 import os
 import numpy as np
 import logging
+from functools import lru_cache
 from scipy.io import loadmat
-from collections.abc import Iterable
 from scipy.interpolate import RegularGridInterpolator, RectBivariateSpline, interp1d
 from seafreeze import seafreeze as SeaFreeze
 from PlanetProfile import _ROOT
@@ -96,14 +96,14 @@ def MgSO4Props(P_MPa, T_K, wOcean_ppt, EXTRAP):
         T_K = np.unique(newT_K)
         if np.size(T_K) == 1:
             T_K = np.linspace(T_K[0] - 0.05, T_K[0] + 0.05, 5)
-    evalPts = fn_MgSO4Props.fn_evalPts(P_MPa, T_K, wOcean_ppt)
-    nPs = np.size(P_MPa)
     # Interpolate the input data to get the values corresponding to the current ocean comp,
-    # then get the property values for the input (P,T) pairs and reshape to how they need
-    # to be formatted for use in the ocean EOS.
-    rho_kgm3 = np.reshape(fn_MgSO4Props.fn_rho_kgm3(evalPts), (nPs,-1))
-    Cp_JkgK = np.reshape(fn_MgSO4Props.fn_Cp_JkgK(evalPts), (nPs,-1))
-    alpha_pK = np.reshape(fn_MgSO4Props.fn_alpha_pK(evalPts), (nPs,-1))
+    # then get the property values for the input (P,T) pairs, already formatted as
+    # (P,T) grids for use in the ocean EOS.
+    fn_props = fn_MgSO4Props.fn_propsPT(wOcean_ppt)
+    props = fn_props(np.stack(np.meshgrid(P_MPa, T_K, indexing='ij'), axis=-1))
+    rho_kgm3 = props[..., 0]
+    Cp_JkgK = props[..., 1]
+    alpha_pK = props[..., 2]
     kTherm_WmK = fn_MgSO4Props.fn_kTherm_WmK(P_MPa, T_K, wOcean_ppt)  # Placeholder until we implement a self-consistent calculation
 
     return P_MPa, T_K, rho_kgm3, Cp_JkgK, alpha_pK, kTherm_WmK
@@ -114,42 +114,44 @@ class MgSO4propsLookup:
         self.fLookup = os.path.join(_ROOT, 'Thermodynamics','MgSO4','EOS2_MgSO4_planetary_smaller_20121116.mat')
         if self.fLookup in EOSlist.loaded.keys():
             log.debug('MgSO4 properties lookup table already loaded. Reusing previously loaded table.')
-            self.fn_rho_kgm3, self.fn_Cp_JkgK, self.fn_alpha_pK, self.fn_kTherm_WmK, self.fn_evalPts = EOSlist.loaded[self.fLookup]
+            self.PMgSO4_MPa, self.TMgSO4_K, self.fn_propsw, self.fn_kTherm_WmK = EOSlist.loaded[self.fLookup]
             self.Pmin, self.Pmax, self.Tmin, self.Tmax, self.wMax = EOSlist.ranges[self.fLookup]
         else:
             log.debug(f'Loading MgSO4 properties lookup table at {self.fLookup}.')
             fMgSO4Props = loadmat(self.fLookup)
-            TMgSO4_K = fMgSO4Props['T_smaller_C'][0] + Constants.T0
+            self.TMgSO4_K = fMgSO4Props['T_smaller_C'][0] + Constants.T0
+            self.PMgSO4_MPa = fMgSO4Props['P_smaller_MPa'][0]
             wMgSO4_ppt = Molal2ppt(fMgSO4Props['m_smaller_molal'][0], Constants.mMgSO4_gmol)
-            self.fn_rho_kgm3 = RegularGridInterpolator((wMgSO4_ppt, fMgSO4Props['P_smaller_MPa'][0], TMgSO4_K),
-                                                        fMgSO4Props['rho'], bounds_error=False, fill_value=None)
-            self.fn_Cp_JkgK = RegularGridInterpolator((wMgSO4_ppt, fMgSO4Props['P_smaller_MPa'][0], TMgSO4_K),
-                                                       fMgSO4Props['Cp'], bounds_error=False, fill_value=None)
-            self.fn_alpha_pK = RegularGridInterpolator((wMgSO4_ppt, fMgSO4Props['P_smaller_MPa'][0], TMgSO4_K),
-                                                        fMgSO4Props['alpha'], bounds_error=False, fill_value=None)
+            # Stack rho, Cp, and alpha along a trailing axis so all three are interpolated together.
+            # Concentration is fixed for each ocean, so we interpolate (linearly, as before) along w first
+            # to get (P,T) tables of shape nP x nT x 3, with properties in that order.
+            self.fn_propsw = interp1d(wMgSO4_ppt, np.stack((fMgSO4Props['rho'], fMgSO4Props['Cp'], fMgSO4Props['alpha']), axis=-1),
+                                      axis=0, fill_value='extrapolate', assume_sorted=True)
             self.fn_kTherm_WmK = lambda P, T, w: np.zeros((np.size(P), np.size(T))) + Constants.kThermWater_WmK
 
-            self.Pmin = np.min(fMgSO4Props['P_smaller_MPa'][0])
-            self.Pmax = np.max(fMgSO4Props['P_smaller_MPa'][0])
-            self.Tmin = np.min(TMgSO4_K)
-            self.Tmax = np.max(TMgSO4_K)
+            self.Pmin = np.min(self.PMgSO4_MPa)
+            self.Pmax = np.max(self.PMgSO4_MPa)
+            self.Tmin = np.min(self.TMgSO4_K)
+            self.Tmax = np.max(self.TMgSO4_K)
             self.wMax = np.max(wMgSO4_ppt)
 
-            EOSlist.loaded[self.fLookup] = (self.fn_rho_kgm3, self.fn_Cp_JkgK, self.fn_alpha_pK, self.fn_kTherm_WmK, self.fn_evalPts)
+            EOSlist.loaded[self.fLookup] = (self.PMgSO4_MPa, self.TMgSO4_K, self.fn_propsw, self.fn_kTherm_WmK)
             EOSlist.ranges[self.fLookup] = (self.Pmin, self.Pmax, self.Tmin, self.Tmax, self.wMax)
 
-    def fn_evalPts(self, Pin_MPa, Tin_K, win_ppt):
-        P_MPa = ensureArray(Pin_MPa)
-        T_K = ensureArray(Tin_K)
-        w_ppt = ensureArray(win_ppt)
-        out = [[w, P, T] for w in w_ppt for P in P_MPa for T in T_K]
-        return np.array(out)
+    def fn_propsPT(self, w_ppt):
+        """ Get an interpolator for rho, Cp, and alpha over (P,T) at a fixed concentration w_ppt.
+            Evaluating it on points of shape (..., 2) returns shape (..., 3).
+            Interpolators are reused for each concentration, as the ocean EOS is
+            typically evaluated many times for the same ocean composition.
+        """
+        propsLabel = f'{self.fLookup}_w{w_ppt}'
+        fn_props = EOSlist.loaded.get(propsLabel)
+        if fn_props is None:
+            fn_props = RegularGridInterpolator((self.PMgSO4_MPa, self.TMgSO4_K), self.fn_propsw(w_ppt),
+                                               bounds_error=False, fill_value=None)
+            EOSlist.loaded[propsLabel] = fn_props
+        return fn_props
 
-def ensureArray(var):
-    if isinstance(var, Iterable):
-        return var
-    else:
-        return np.array([var])
 
 class CG2010:
     # Values from the Choukron and Grasset (2010) thermodynamic model (Table 1):
@@ -172,41 +174,101 @@ class CG2010:
     # Set number of integration points to use to evaluate chemical potentials
     nIntPts = 35
 
-    def __init__(self):
-        self.zeta1 = lambda T_K, phase: 1 + self.a0[phase] * np.tanh(self.a1[phase] * (T_K - self.Tref_K[phase]))
-        self.zeta2 = lambda P_MPa, phase: self.b0[phase] + self.b1[phase] * (1 - np.tanh(self.b2[phase] * P_MPa))
-        self.CpIce_JkgK = [lambda T, phase=icePhase: self.c0[phase] + self.c1[phase] * T for icePhase in range(1,7)]
-        self.CpLiq_JkgK = lambda T: self.c0[0] + self.c1[0] * np.exp(-0.11 * (T - 281.6))
-        self.CpRelativeIntegral = [lambda T, phase=icePhase: Integral(lambda Tp: (self.CpIce_JkgK[phase-1](Tp) - self.CpLiq_JkgK(Tp)) -
-                                                                               T*(self.CpIce_JkgK[phase-1](Tp) - self.CpLiq_JkgK(Tp))/Tp,
-                                                                      self.T0_K[phase], T, nPts=self.nIntPts) for icePhase in range(1,7)]
-        self.Vsp_m3kg = [lambda P, T, phase=icePhase: self.V0_m3kg[phase] * self.zeta1(T, phase) * self.zeta2(P, phase) for icePhase in range(7)]
-        self.VRelativeIntegral = [lambda P, T, phase=icePhase: Integral(lambda Pp: self.Vsp_m3kg[phase](Pp, T) - self.Vsp_m3kg[0](Pp, T),
-                                                                        self.P0_MPa[phase], P, nPts=self.nIntPts)*1e6 for icePhase in range(7)]
-        self.W_Jkg = lambda P_MPa, T_K: -1.8e6 * (1 + 150 * np.tanh(1.45e-4 * P_MPa)) * (1 + -12/(T_K - 246)**2)
+    @classmethod
+    def zeta1(cls, T_K, phase):
+        return 1 + cls.a0[phase] * np.tanh(cls.a1[phase] * (T_K - cls.Tref_K[phase]))
+
+    @classmethod
+    def zeta2(cls, P_MPa, phase):
+        return cls.b0[phase] + cls.b1[phase] * (1 - np.tanh(cls.b2[phase] * P_MPa))
+
+    @classmethod
+    def CpIce_JkgK(cls, T_K, phase):
+        return cls.c0[phase] + cls.c1[phase] * T_K
+
+    @classmethod
+    def CpLiq_JkgK(cls, T_K):
+        return cls.c0[0] + cls.c1[0] * np.exp(-0.11 * (T_K - 281.6))
+
+    @classmethod
+    def Vsp_m3kg(cls, P_MPa, T_K, phase):
+        return cls.V0_m3kg[phase] * cls.zeta1(T_K, phase) * cls.zeta2(P_MPa, phase)
+
+    @staticmethod
+    def W_Jkg(P_MPa, T_K):
+        """ Margules interaction parameter W for the ocean liquid, in J/kg """
+        return -1.8e6 * (1 + 150 * np.tanh(1.45e-4 * P_MPa)) * (1 - 12/(T_K - 246)**2)
+
+    def CpRelIntegral(self, phase, T_K):
+        """ Heat capacity contribution to the chemical potential of ice phase relative
+            to liquid, integrated from the reference temperature T0_K of the phase.
+            Single points are cached, as phase finding revisits the same (P,T) repeatedly.
+        """
+        if np.size(T_K) == 1:
+            return self._CpRelIntegralPt(phase, float(np.squeeze(T_K)))
+        return self._CpRelIntegral(phase, T_K)
+
+    def VRelIntegral(self, phase, P_MPa, T_K):
+        """ Specific volume contribution to the chemical potential of ice phase relative
+            to liquid, integrated from the reference pressure P0_MPa of the phase.
+            Single points are cached as for CpRelIntegral.
+        """
+        if np.size(P_MPa) == 1 and np.size(T_K) == 1:
+            return self._VRelIntegralPt(phase, float(np.squeeze(P_MPa)), float(np.squeeze(T_K)))
+        return self._VRelIntegral(phase, P_MPa, T_K)
+
+    def _CpRelIntegral(self, phase, T_K):
+        # The upper bound T also appears in the integrand, so add an axis to line it up with the integration points
+        Tupper_K = np.asarray(T_K)[..., np.newaxis]
+        return Integral(lambda Tp: (self.CpIce_JkgK(Tp, phase) - self.CpLiq_JkgK(Tp)) * (1 - Tupper_K/Tp),
+                        self.T0_K[phase], T_K, nPts=self.nIntPts)
+
+    def _VRelIntegral(self, phase, P_MPa, T_K):
+        # Only zeta2 depends on P, so the T-dependent factors come out of the integral.
+        # The integrals are then evaluated once per pressure, not once per (P,T) point.
+        zeta2Int = [Integral(lambda Pp: self.zeta2(Pp, iPhase), self.P0_MPa[phase], P_MPa, nPts=self.nIntPts)
+                    for iPhase in [phase, 0]]
+        return (self.V0_m3kg[phase] * self.zeta1(T_K, phase) * zeta2Int[0]
+                - self.V0_m3kg[0] * self.zeta1(T_K, 0) * zeta2Int[1]) * 1e6
+
+    @lru_cache(maxsize=4096)
+    def _CpRelIntegralPt(self, phase, T_K):
+        return self._CpRelIntegral(phase, T_K)
+
+    @lru_cache(maxsize=4096)
+    def _VRelIntegralPt(self, phase, P_MPa, T_K):
+        return self._VRelIntegral(phase, P_MPa, T_K)
 
 CG = CG2010()
 
 
-def Integral(func, a, b, nPts=50):
+def Integral(func, a, b, nPts=50, maxEvalSize=2**16):
     """ A function to integrate a Reimann sum, as scipy.integrate.quad seems
         to keep getting the wrong answer. Lower bound must be only one point,
         but upper bound may be an array. This is because where we need the
         integration in evaluating chemical potential, the reference point
         (lower bound) is fixed for each phase.
+
+        The integrand is evaluated for all upper bounds at once, on a grid with
+        the integration points along the last axis, so func must broadcast
+        over arrays with an extra trailing dimension. For large arrays of upper
+        bounds, the integration points are taken in chunks so that at most
+        about maxEvalSize points are evaluated at a time.
     """
-    b = np.array(b)
-    nb = np.size(b)
-    result = np.zeros(nb)
-    for ib, xb in np.ndenumerate(b):
-        if a != xb:
-            evalPts = np.linspace(a, xb, nPts)
-            dx = evalPts[1] - evalPts[0]
-            integrand = np.array([func(evalPt)*dx for evalPt in evalPts])
-            result[ib] = np.sum(integrand)
-
-    if nb == 1:
-        return result[0]
+    b = np.asarray(b, dtype=np.float_)
+    dx = (b - a) / (nPts - 1)
+    nPtsChunk = max(1, min(nPts, maxEvalSize // max(1, b.size)))
+    if nPtsChunk == nPts:
+        result = np.sum(func(np.linspace(a, b, nPts, axis=-1)), axis=-1)
+    else:
+        result = np.zeros(b.shape)
+        for iStart in range(0, nPts, nPtsChunk):
+            iPts = np.arange(iStart, min(iStart + nPtsChunk, nPts))
+            result += np.sum(func(a + dx[..., np.newaxis] * iPts), axis=-1)
+    result *= dx
+
+    if np.size(result) == 1:
+        return result.item()
     else:
         return result
 
@@ -219,67 +281,69 @@ class MgSO4PhaseMargules:
     def __init__(self, wOcean_ppt):
         self.w_ppt = wOcean_ppt
         self.xH2O, self.mBar_gmol = Massppt2molFrac(self.w_ppt, Constants.mMgSO4_gmol)
+        # Composition-dependent factors of the liquid chemical potential, fixed for each ocean
+        self.WFactor = (1 - self.xH2O)**2
+        self.idealMixFactor_JkgK = Constants.R / (self.mBar_gmol*1e-3) * np.log(self.xH2O)
+
+    def DeltamuLiquid_Jkg(self, P_MPa, T_K):
+        """ Chemical potential mu for the ocean liquid based on the Margules
+            equations as in Eqs. 2-4 of Vance et al. 2014:
+            http://dx.doi.org/10.1016/j.pss.2014.03.011
+        """
+        return CG.W_Jkg(P_MPa, T_K) * self.WFactor + T_K * self.idealMixFactor_JkgK
 
     def __call__(self, P_MPa, T_K):
-        self.nPs = np.size(P_MPa)
-        self.nTs = np.size(T_K)
-        if(self.nPs == 0 or self.nTs == 0):
+        """ Get the phase for P_MPa and T_K, which may be scalars or any arrays that
+            broadcast against each other. The result has the broadcast shape.
+        """
+        if(np.size(P_MPa) == 0 or np.size(T_K) == 0):
             # If input is empty, return empty array
             return np.array([])
-        elif(self.nPs != 1 or self.nTs != 1):
-            raise RuntimeError('For computational reasons, the Margules formulation has not been ' +
-                               'fully implemented for arrays of P and T. Query MgSO4 phase for ' +
-                               'single points only until a more rapid+accurate method is implemented.')
-        #
-        # elif((self.nPs != self.nTs) and not (self.nPs == 1 or self.nTs == 1)):
-        #     # If arrays are different lengths, they are probably meant to get a 2D output
-        #     P_MPa, T_K = np.meshgrid(P_MPa, T_K, indexing='ij')
-
-        # Determine the chemical potential mu for the ocean liquid based on
-        # the Margules equations as in Eqs. 2-4 of Vance et al. 2014:
-        # http://dx.doi.org/10.1016/j.pss.2014.03.011
-        DeltamuLiquid_Jkg = (CG.W_Jkg(P_MPa,T_K) * (1 - self.xH2O)**2 + Constants.R*T_K/(self.mBar_gmol*1e-3) * np.log(self.xH2O))
-        DeltamuIce_Jkg = np.array([CG.DeltaH0_Jkg[phase] - T_K*CG.DeltaS0_JkgK[phase] + CG.CpRelativeIntegral[phase-1](T_K)
-                                    + CG.VRelativeIntegral[phase](P_MPa,T_K) for phase in range(1,7)])
-        DeltamuAll_Jkg = np.insert(DeltamuIce_Jkg, 0, DeltamuLiquid_Jkg, axis=0)
-        # Set ice IV to have infinite chemical potential so it is never considered energetically favorable
-        DeltamuAll_Jkg[4] = np.inf
-
-        return np.argmin(DeltamuAll_Jkg, axis=0)
+        if np.ndim(P_MPa) == 0 and np.ndim(T_K) == 0:
+            # Root finding revisits the same single points often, so these are cached
+            return _MgSO4PhaseMargulesPt(float(P_MPa), float(T_K), self.w_ppt)
+        return self.Phase(P_MPa, T_K)
+
+    def Phase(self, P_MPa, T_K):
+        """ Uncached phase evaluation for __call__ """
+        P_MPa = np.asarray(P_MPa, dtype=np.float_)
+        T_K = np.asarray(T_K, dtype=np.float_)
+
+        # Keep a running minimum of the chemical potential and the phase it belongs to,
+        # starting from the liquid, instead of stacking all phases for argmin.
+        # Ice IV is skipped so it is never considered energetically favorable.
+        phase = np.zeros(np.broadcast(P_MPa, T_K).shape, dtype=np.intp)
+        DeltamuMin_Jkg = self.DeltamuLiquid_Jkg(P_MPa, T_K) + np.zeros(phase.shape)
+        for icePhase in [1, 2, 3, 5, 6]:
+            DeltamuIce_Jkg = CG.DeltaH0_Jkg[icePhase] - T_K*CG.DeltaS0_JkgK[icePhase] \
+                             + CG.CpRelIntegral(icePhase, T_K) + CG.VRelIntegral(icePhase, P_MPa, T_K)
+            LOWER = DeltamuIce_Jkg < DeltamuMin_Jkg
+            phase[LOWER] = icePhase
+            DeltamuMin_Jkg = np.where(LOWER, DeltamuIce_Jkg, DeltamuMin_Jkg)
+
+        return phase[()]
 
     def arrays(self, P_MPa, T_K):
         self.nPs = np.size(P_MPa)
         self.nTs = np.size(T_K)
-        if np.maximum(self.nPs, self.nTs) > 300:
-            WARN_LONG = True
-        else:
-            WARN_LONG = False
         if(self.nPs == 0 or self.nTs == 0):
             # If input is empty, return empty array
             return np.array([])
-        elif self.nPs == 1 and self.nTs == 1:
+        elif self.nPs == 1 or self.nTs == 1 or self.nTs == self.nPs:
+            # Single points, a list of P or T values, or (P,T) pairs
             phase = self.__call__(P_MPa, T_K)
-        elif self.nPs == 1:
-            if WARN_LONG:
-                log.debug(f'Applying Margules phase finder for MgSO4 with {self.nTs} T values. This may take some time.')
-            phase = np.array([self.__call__(P_MPa, T) for T in T_K])
-        elif self.nTs == 1:
-            if WARN_LONG:
-               log.debug(f'Applying Margules phase finder for MgSO4 with {self.nPs} P values. This may take some time.')
-            phase = np.array([self.__call__(P, T_K) for P in P_MPa])
-        elif self.nTs == self.nPs:
-            if WARN_LONG:
-                log.debug(f'Applying Margules phase finder for MgSO4 with {self.nPs} (P,T) pairs. This may take some time.')
-            phase = np.array([self.__call__(P, T_K[i]) for i, P in np.ndenumerate(P_MPa)])
         else:
-            if WARN_LONG:
-                log.debug(f'Applying Margules phase finder for MgSO4 with {self.nPs} P values and ' +
-                     f'{self.nTs} T values. This may take some time.')
-            phase = np.array([[self.__call__(P, T) for T in T_K] for P in P_MPa])
+            # Grid of P and T values, evaluated all at once as nPs x nTs
+            phase = self.__call__(np.reshape(P_MPa, (-1, 1)), np.reshape(T_K, (1, -1)))
 
         return phase
 
 
+@lru_cache(maxsize=65536)
+def _MgSO4PhaseMargulesPt(P_MPa, T_K, w_ppt):
+    return MgSO4PhaseMargules(w_ppt).Phase(P_MPa, T_K)
+
+
 class MgSO4PhaseLookup:
     """ Use a lookup table to determine the phase of liquid/ice within the hydrosphere
         for an ocean with dissolved MgSO4, given a span of P_MPa, T_K, and w_ppt.
@@ -319,16 +383,13 @@ class MgSO4PhaseLookup:
         nTs = np.size(T_K)
         if nPs == 1 and nTs == 1:
             evalPts = np.array([P_MPa, T_K, self.w_ppt])
+        elif nPs == nTs or nPs == 1 or nTs == 1:
+            # (P,T) pairs, or a single P or T value broadcast against the other
+            P_MPa, T_K = np.broadcast_arrays(np.ravel(P_MPa).astype(np.float_), np.ravel(T_K))
+            evalPts = np.stack((P_MPa, T_K, np.full(P_MPa.shape, self.w_ppt)), axis=-1)
         else:
-            if nPs == nTs:
-                evalPts = np.array([[P, T, self.w_ppt] for P, T in zip(P_MPa, T_K)])
-            elif nPs == 1:
-                evalPts = np.array([[P_MPa, T, self.w_ppt] for T in T_K])
-            elif nTs == 1:
-                evalPts = np.array([[P, T_K, self.w_ppt] for P in P_MPa])
-            else:
-                raise ValueError(f'Length {nPs} array of P values does not match ' +
-                                 f'length {nTs} array of T values. Grids are not supported.')
+            raise ValueError(f'Length {nPs} array of P values does not match ' +
+                             f'length {nTs} array of T values. Grids are not supported.')
 
         phase = self.fn_phase(evalPts)
 
@@ -391,14 +452,23 @@ class MgSO4Conduct:
         self.w_ppt = wOcean_ppt
         self.type = elecType
         if self.type == 'Vance2018':
-            self.Pvals_MPa, self.Tvals_K, self.sigma_Sm = LarionovKryukov1984(self.w_ppt,
-                                                                              rhoType=rhoType, scalingType=scalingType)
-        elif self.type == 'Pan2020':
-            self.Pvals_MPa, self.Tvals_K, self.sigma_Sm = Panetal2020()
+            self.condLabel = f'MgSO4Conduct_{self.type}_w{self.w_ppt}_{rhoType}_{scalingType}'
         else:
-            raise ValueError(f'No MgSO4 conductivity model is specified for Ocean.electrical = "{self.type}"')
+            self.condLabel = f'MgSO4Conduct_{self.type}'
+        if self.condLabel in EOSlist.loaded.keys():
+            log.debug(f'MgSO4 conductivity model {self.condLabel} already loaded. Reusing previously loaded model.')
+            self.Pvals_MPa, self.Tvals_K, self.sigma_Sm, self.fn_sigma_Sm = EOSlist.loaded[self.condLabel]
+        else:
+            if self.type == 'Vance2018':
+                self.Pvals_MPa, self.Tvals_K, self.sigma_Sm = LarionovKryukov1984(self.w_ppt,
+                                                                                  rhoType=rhoType, scalingType=scalingType)
+            elif self.type == 'Pan2020':
+                self.Pvals_MPa, self.Tvals_K, self.sigma_Sm = Panetal2020()
+            else:
+                raise ValueError(f'No MgSO4 conductivity model is specified for Ocean.electrical = "{self.type}"')
 
-        self.fn_sigma_Sm = RectBivariateSpline(self.Pvals_MPa, self.Tvals_K, self.sigma_Sm)
+            self.fn_sigma_Sm = RectBivariateSpline(self.Pvals_MPa, self.Tvals_K, self.sigma_Sm)
+            EOSlist.loaded[self.condLabel] = (self.Pvals_MPa, self.Tvals_K, self.sigma_Sm, self.fn_sigma_Sm)
 
     def __call__(self, P_MPa, T_K, grid=False):
         return self.fn_sigma_Sm(P_MPa, T_K, grid=grid)
@@ -466,8 +536,9 @@ def LarionovKryukov1984(w_ppt, rhoType='Millero', scalingType='Vance2018'):
     nTs = 8
     Pextrap_MPa = np.linspace(0.1, 1900.1, nPs)
     Textrap_K = np.concatenate((np.linspace(250, 270, nTs-3), [273, 298, 323]))
-    sigmaPextrap_Sm = np.array([interp1d(PLK_MPa, sigmaLK_Sm[:,iT], kind='linear', fill_value='extrapolate')(Pextrap_MPa) for iT in range(3)])
-    sigmaExtrap_Sm = np.array([interp1d(TLK_K[:3], sigmaPextrap_Sm[:,iP], kind='linear', fill_value='extrapolate')(Textrap_K) for iP in range(nPs)])
+    # Extrapolate in P for the 3 lowest-T columns at once, then in T for all P rows at once
+    sigmaPextrap_Sm = interp1d(PLK_MPa, sigmaLK_Sm[:,:3], kind='linear', axis=0, fill_value='extrapolate')(Pextrap_MPa)
+    sigmaExtrap_Sm = interp1d(TLK_K[:3], sigmaPextrap_Sm, kind='linear', axis=1, fill_value='extrapolate')(Textrap_K)
 
     return Pextrap_MPa, Textrap_K, sigmaExtrap_Sm * Vance2018scaling
 
@@ -58,9 +58,9 @@ def gswT2conservT(wOcean_ppt, T_C, SP_dbar, DO_1D=False):
                 values.
     """
     if DO_1D:
-        CT_C = np.array([CT_from_t(wOcean_ppt, T_C[i], SP_dbar[i]) for i in range(np.size(SP_dbar))])
+        CT_C = CT_from_t(wOcean_ppt, T_C, SP_dbar)
     else:
-        CT_C = np.array([CT_from_t(wOcean_ppt, T_C, SPi_dbar) for SPi_dbar in SP_dbar])
+        CT_C = CT_from_t(wOcean_ppt, T_C, SeaPressureRows(SP_dbar, np.ndim(T_C)))
     return CT_C
 
 
@@ -68,7 +68,7 @@ def gswEnthalpy_Jkg(wOcean_ppt, CT_C, SP_dbar):
     """ Wrapper for GSW function enthalpy that can simultaneously handle
         P and T arrays.
     """
-    H_Jkg = np.array([enthalpy(wOcean_ppt, CT_C[i,:], SP_dbar[i]) for i in range(np.size(SP_dbar))])
+    H_Jkg = enthalpy(wOcean_ppt, CT_C, SeaPressureRows(SP_dbar, np.ndim(CT_C) - 1))
     return H_Jkg
 
 
@@ -82,9 +82,9 @@ def gswDensity_kgm3(wOcean_ppt, CT_C, SP_dbar, DO_1D=False):
                 values.
     """
     if DO_1D:
-        rho_kgm3 = np.array([rho(wOcean_ppt, CT_C[i], SP_dbar[i]) for i in range(np.size(SP_dbar))])
+        rho_kgm3 = rho(wOcean_ppt, CT_C, SP_dbar)
     else:
-        rho_kgm3 = np.array([rho(wOcean_ppt, CT_C[i,:], SP_dbar[i]) for i in range(np.size(SP_dbar))])
+        rho_kgm3 = rho(wOcean_ppt, CT_C, SeaPressureRows(SP_dbar, np.ndim(CT_C) - 1))
     return rho_kgm3
 
 
@@ -92,7 +92,7 @@ def gswExpansivityCT_pK(wOcean_ppt, CT_C, SP_dbar):
     """ Wrapper for GSW function alpha that can simultaneously handle
         P and T arrays.
     """
-    alphawrtCT_pK = np.array([alpha(wOcean_ppt, CT_C[i,:], SP_dbar[i]) for i in range(np.size(SP_dbar))])
+    alphawrtCT_pK = alpha(wOcean_ppt, CT_C, SeaPressureRows(SP_dbar, np.ndim(CT_C) - 1))
     return alphawrtCT_pK
 
 
@@ -100,7 +100,7 @@ def gswExpansivity_pK(wOcean_ppt, T_C, SP_dbar):
     """ Wrapper for GSW function alpha_wrt_t_exact that can simultaneously handle
         P and T arrays.
     """
-    alphawrt_pK = np.array([alpha(wOcean_ppt, T_C, SPi_dbar) for SPi_dbar in SP_dbar])
+    alphawrt_pK = alpha(wOcean_ppt, T_C, SeaPressureRows(SP_dbar, np.ndim(T_C)))
     return alphawrt_pK
 
 
@@ -124,21 +124,14 @@ def GetdCTdTanddHdT(wOcean_ppt, CT_C, SP_dbar, T_C, dT=0.01):
     # Get CT a bit above and a bit below each of the evaluated points
     CTplus_C = gswT2conservT(wOcean_ppt, T_C+dT, SP_dbar)
     CTless_C = gswT2conservT(wOcean_ppt, T_C-dT, SP_dbar)
-    # Get dCT, the difference in CT with respect to this small change in T dT
-    dCTplus = CTplus_C - CT_C
-    dCTless = CT_C - CTless_C
-    # Take the average value between the numerically evaluated derivatives above and below
-    dCTdT = np.mean([dCTplus/dT, dCTless/dT], axis=0)
-
-    # Use the 3 sets of CT values to also evaluate H(T+/-dT)
-    Hmid_Jkg = gswEnthalpy_Jkg(wOcean_ppt, CT_C, SP_dbar)
+    # Take the central difference, equal to the average of the numerically evaluated
+    # derivatives above and below, so CT at the evaluated points is not needed
+    dCTdT = (CTplus_C - CTless_C) / (2*dT)
+
+    # Use the above and below CT values to also evaluate H(T+/-dT) and its central difference
     Hplus_Jkg = gswEnthalpy_Jkg(wOcean_ppt, CTplus_C, SP_dbar)
     Hless_Jkg = gswEnthalpy_Jkg(wOcean_ppt, CTless_C, SP_dbar)
-    # Get differences in H
-    dHplus = Hplus_Jkg - Hmid_Jkg
-    dHless = Hmid_Jkg - Hless_Jkg
-    # Take the average value between the numerically evaluated derivatives above and below
-    dHdT = np.mean([dHplus/dT, dHless/dT], axis=0)
+    dHdT = (Hplus_Jkg - Hless_Jkg) / (2*dT)
 
     return dCTdT, dHdT
 
@@ -162,7 +155,17 @@ class SwPhase:
         # 3. Compare to zero -- if we are below the freezing temp, it's ice I, above, liquid
         # 4. Cast the above comparison (True if less than Tfreeze, False if greater) to int,
         #       so that we get 1 if we are below the freezing temp and 0 if above.
-        return (((T_K - Constants.T0) - gswTfreeze(self.w_ppt, MPa2seaPressure(P_MPa), 0)) < 0).astype(np.int_)
+        T_C, SP_dbar = np.broadcast_arrays(T_K - Constants.T0, MPa2seaPressure(P_MPa))
+        phase = np.zeros(T_C.shape, dtype=np.int_)
+        if self.w_ppt <= 120:
+            # Within the GSW range of validity (up to 120 g/kg and 10^4 dbar), the freezing
+            # temperature never exceeds 0.01 C, so points more than 1 K warmer than that are liquid
+            # and need no GSW evaluation
+            CHECK = np.logical_or(T_C < 1, SP_dbar > 1e4)
+        else:
+            CHECK = np.ones(T_C.shape, dtype=np.bool_)
+        phase[CHECK] = (T_C[CHECK] - gswTfreeze(self.w_ppt, SP_dbar[CHECK], 0)) < 0
+        return phase[()]
 
 
 class SwSeismic:
@@ -177,8 +180,12 @@ class SwSeismic:
         T_C = T_K - Constants.T0
         SP_dbar = MPa2seaPressure(P_MPa)
         CT_C = gswT2conservT(self.w_ppt, T_C, SP_dbar, DO_1D=True)
-        VP_kms = gswVP_ms(self.w_ppt, CT_C, SP_dbar) * 1e-3  # 1e-3 to convert from m/s to km/s
-        KS_GPa = gswDensity_kgm3(self.w_ppt, CT_C, SP_dbar, DO_1D=True) * VP_kms**2 * 1e-3  # 1e-3 because (km/s)^2 * (kg/m^3) gives units of MPa, so 1e-3 to convert to GPa
+        # Scale the GSW outputs in place to avoid temporaries
+        VP_kms = gswVP_ms(self.w_ppt, CT_C, SP_dbar)
+        VP_kms *= 1e-3  # 1e-3 to convert from m/s to km/s
+        KS_GPa = gswDensity_kgm3(self.w_ppt, CT_C, SP_dbar, DO_1D=True)
+        KS_GPa *= VP_kms
+        KS_GPa *= VP_kms * 1e-3  # 1e-3 because (km/s)^2 * (kg/m^3) gives units of MPa, so 1e-3 to convert to GPa
         return VP_kms, KS_GPa
 
 
@@ -198,6 +205,21 @@ class SwConduct:
         return gswConduct_mScm(self.PracSalin, T_C, SP_dbar) * 0.1
 
 
+def SeaPressureRows(SP_dbar, nDimsPerRow):
+    """ Reshape a list of sea pressures so that GSW functions broadcast each
+        pressure across one row of the other input, giving outputs with pressure
+        along the first axis as for a loop over SP_dbar.
+
+        Args:
+            SP_dbar (float, shape N): Sea pressures in dbar
+            nDimsPerRow (int): Number of dimensions of the other input for each pressure,
+                e.g. 1 for a shape M array of T values or a row of an NxM array of CT values
+        Returns:
+            SP_dbar (float, shape N x 1 x ...): Sea pressures with nDimsPerRow trailing singleton dimensions
+    """
+    return np.reshape(SP_dbar, (-1,) + (1,)*nDimsPerRow)
+
+
 def MPa2seaPressure(P_MPa):
     """ Calculates "sea pressure" as needed for inputs to GSW functions.
         Sea pressure is defined as the pressure relative to the top of
@@ -208,9 +230,8 @@ def MPa2seaPressure(P_MPa):
         Returns:
             SP_dbar (float, shape N or NxM): Sea pressures in dbar (1 dbar = 0.1 bar = 0.1 * bar2MPa MPa)
     """
-    # Subtract off Earth atmospheric pressure
-    SP_MPa = P_MPa - Constants.bar2MPa
-    # Convert to dbar
-    SP_dbar = SP_MPa * 10 / Constants.bar2MPa
+    # Subtract off Earth atmospheric pressure, then convert to dbar in place
+    SP_dbar = np.subtract(P_MPa, Constants.bar2MPa)
+    SP_dbar *= 10 / Constants.bar2MPa
 
     return SP_dbar
@@ -3,10 +3,9 @@
 import os
 import numpy as np
 import logging
-from collections.abc import Iterable
 from PlanetProfile import _ROOT
 from PlanetProfile.GetConfig import FigMisc, FigLbl
-from PlanetProfile.Thermodynamics.HydroEOS import GetOceanEOS
+from PlanetProfile.Thermodynamics.HydroEOS import GetOceanEOS, GetPfreezeGrid
 from PlanetProfile.Thermodynamics.InnerEOS import GetInnerEOS
 from PlanetProfile.Thermodynamics.Clathrates.ClathrateProps import ClathDissoc
 from PlanetProfile.Utilities.PPversion import ppVerNum, CheckCompat
@@ -167,7 +166,7 @@ def SetupInit(Planet, Params):
                                        scalingType=Planet.Ocean.MgSO4scalingType, FORCE_NEW=Params.FORCE_EOS_RECALC,
                                        phaseType=Planet.Ocean.phaseType, EXTRAP=Params.EXTRAP_OCEAN)
         # Get separate, simpler EOS for evaluating the melting curve
-        Pmelt_MPa = np.arange(Planet.PfreezeLower_MPa, Planet.PfreezeUpper_MPa, Planet.PfreezeRes_MPa)
+        Pmelt_MPa = GetPfreezeGrid(Planet.PfreezeLower_MPa, Planet.PfreezeUpper_MPa, Planet.PfreezeRes_MPa)
         Planet.Ocean.meltEOS = GetOceanEOS(Planet.Ocean.comp, Planet.Ocean.wOcean_ppt, Pmelt_MPa,
                                            np.linspace(Planet.Bulk.Tb_K - 0.01, Planet.Bulk.Tb_K + 0.01, 11), None,
                                            phaseType=Planet.Ocean.phaseType, FORCE_NEW=True, MELT=True)
@@ -274,15 +273,20 @@ def SetupInit(Planet, Params):
                                           kThermConst_WmK=Planet.Core.kTherm_WmK, EXTRAP=Params.EXTRAP_Fe,
                                           wFeCore_ppt=Planet.Core.wFe_ppt, wScore_ppt=Planet.Core.wS_ppt)
 
-    # Ensure ionosphere bounds and conductivity are in a format we expect
+    # Ensure ionosphere bounds and conductivity are float arrays, so later steps can use them directly
     if Planet.Magnetic.ionosBounds_m is None:
         Planet.Magnetic.ionosBounds_m = [np.nan]
-    elif not isinstance(Planet.Magnetic.ionosBounds_m, Iterable):
-        Planet.Magnetic.ionosBounds_m = [Planet.Magnetic.ionosBounds_m]
     if Planet.Magnetic.sigmaIonosPedersen_Sm is None:
         Planet.Magnetic.sigmaIonosPedersen_Sm = [np.nan]
-    elif not isinstance(Planet.Magnetic.sigmaIonosPedersen_Sm, Iterable):
-        Planet.Magnetic.sigmaIonosPedersen_Sm = [Planet.Magnetic.sigmaIonosPedersen_Sm]
+    Planet.Magnetic.ionosBounds_m = np.atleast_1d(np.asarray(Planet.Magnetic.ionosBounds_m, dtype=np.float64))
+    Planet.Magnetic.sigmaIonosPedersen_Sm = np.atleast_1d(np.asarray(Planet.Magnetic.sigmaIonosPedersen_Sm, dtype=np.float64))
+    nIonosBds = np.size(Planet.Magnetic.ionosBounds_m)
+    nSigmaIonos = np.size(Planet.Magnetic.sigmaIonosPedersen_Sm)
+    # A single conductivity with 2 bounds is allowed, for a conducting region at altitude (e.g. for Triton)
+    if not (np.all(np.isnan(Planet.Magnetic.ionosBounds_m)) or np.all(np.isnan(Planet.Magnetic.sigmaIonosPedersen_Sm))) \
+        and nSigmaIonos != nIonosBds and not (nSigmaIonos == 1 and nIonosBds == 2):
+        raise ValueError(f'Magnetic.sigmaIonosPedersen_Sm has {nSigmaIonos} entries, but it must match the ' +
+                         f'{nIonosBds} entries in Magnetic.ionosBounds_m.')
 
     # Preallocate layer physical quantity arrays
     Planet = SetupLayers(Planet)
@@ -368,11 +372,13 @@ def SetupLayers(Planet):
         Planet.Steps.nHydroMax = Planet.Steps.nClath + Planet.Steps.nIceI + Planet.Steps.nIceIIILitho + Planet.Steps.nIceVLitho + nOceanMax
     
     Planet.phase = np.zeros(Planet.Steps.nHydroMax, dtype=np.int_)
+    # Allocate the float layer arrays as rows of a single contiguous block, so that
+    # they are created with one allocation and each row is contiguous in memory
     Planet.P_MPa, Planet.T_K, Planet.r_m, Planet.rho_kgm3, \
         Planet.Cp_JkgK, Planet.alpha_pK, Planet.g_ms2, Planet.phi_frac, \
         Planet.sigma_Sm, Planet.z_m, Planet.MLayer_kg, Planet.VLayer_m3, Planet.kTherm_WmK, \
         Planet.Htidal_Wm3, Planet.Ppore_MPa, Planet.rhoMatrix_kgm3, Planet.rhoPore_kgm3 = \
-        (np.zeros(Planet.Steps.nHydroMax) for _ in range(17))
+        np.zeros((17, Planet.Steps.nHydroMax))
 
     # Layer property initialization for surface
     Planet.z_m[0] = 0.0  # Set first layer depth to zero (layer properties correspond to outer radius)
@@ -125,8 +125,6 @@ class OceanSubstruct:
         self.rhoConvMean_kgm3 = {phase: np.nan for phase in ['Ih', 'II', 'III', 'V', 'VI', 'Clath']}  # Mean density for convecting ice layers
         self.sigmaCondMean_Sm = {phase: np.nan for phase in ['Ih', 'II', 'III', 'V', 'VI', 'Clath']}  # Mean conductivity for conducting ice layers
         self.sigmaConvMean_Sm = {phase: np.nan for phase in ['Ih', 'II', 'III', 'V', 'VI', 'Clath']}  # Mean conductivity for convecting ice layers
-        self.sigmaCondMean_Sm = {phase: np.nan for phase in ['Ih', 'II', 'III', 'V', 'VI', 'Clath']}  # Mean conductivity for conducting ice layers
-        self.sigmaConvMean_Sm = {phase: np.nan for phase in ['Ih', 'II', 'III', 'V', 'VI', 'Clath']}  # Mean conductivity for convecting ice layers
         self.GScondMean_GPa = {phase: np.nan for phase in ['Ih', 'II', 'III', 'V', 'VI', 'Clath']}  # Mean shear modulus for conducting ice layers
         self.GSconvMean_GPa = {phase: np.nan for phase in ['Ih', 'II', 'III', 'V', 'VI', 'Clath']}  # Mean shear modulus for convecting ice layers
         self.rhoMeanVwet_kgm3 = np.nan  # Mean density for in-ocean ice V layers
@@ -216,7 +214,6 @@ class SilSubstruct:
         """ Mantle Equation of State (EOS) model """
         self.mantleEOS = None  # Equation of state data to use for silicates
         self.mantleEOSName = None  # Same as above but containing keywords like clathrates in filenames
-        self.mantleEOSDry = None  # Name of mantle EOS to use assuming non-hydrated silicates
         self.EOS = None  # Interpolator functions for evaluating Perple_X EOS model
         self.rhoSilWithCore_kgm3 = 3300  # Assumed density of silicates when a core is present in kg/m^3
         # Derived quantities
@@ -228,7 +225,6 @@ class SilSubstruct:
         self.HtidalMean_Wm3 = None  # Mean tidal heating in silicate layers
         self.sigmaMean_Sm = np.nan  # Mean conductivity across all silicate layers, ignoring spherical effects
         self.rhoTrade_kgm3 = None  # Array of mantle densities for compatible MoIs for core vs. mantle tradeoff plot
-        self.mFluids = None  # WIP for tracking loss of fluids along the geotherm -- needs a better name.
 
 
 """ Core layers """
@@ -358,6 +354,9 @@ class MagneticSubstruct:
         self.coordTypeFT = None  # Coordinates of vector components for Fourier spectrum
         self.Ae1FT = None  # Complex amplitude for dipole induced field, for Fourier spectrum
         self.Bi1xyzFT_nT = {'x': None, 'y': None, 'z': None}  # Complex induced dipole moments in Fourier spectrum
+        # Spacecraft closest approach calculations
+        self.etCA = None  # Ephemeris times in s of spacecraft closest approaches found by FindBindCA
+        self.rCA_km = None  # Spacecraft distance from body center in km at each time in etCA
         # Asymmetric boundary plot calculations
         self.nAsymBds = None  # Number of boundaries for which to model asymmetry, including gravity shape
         self.iAsymBds = np.empty(0, dtype=np.int)  # Index of asymShape_m to which the above z values correspond
@@ -518,9 +517,12 @@ class DataFilesSubstruct:
         self.fNameInduct = os.path.join(self.inductPath, saveBase)
         self.inductLayersFile = self.fNameInduct + '_inductLayers.txt'
         self.inducedMomentsFile = self.fNameInduct + '_inducedMoments.mat'
+        self.inducedMomentsNpzFile = self.fNameInduct + '_inducedMoments.npz'
         self.fNameInductOgram = os.path.join(self.inductPath, inductBase)
         self.inductOgramFile = self.fNameInductOgram + f'{comp}_inductOgram.mat'
         self.inductOgramSigmaFile = self.fNameInductOgram + '_sigma_inductOgram.mat'
+        self.inductOgramMomentsFile = self.fNameInductOgram + f'{comp}_inductOgramMoments.mat'
+        self.inductOgramMomentsNpzFile = self.fNameInductOgram + f'{comp}_inductOgramMoments.npz'
         self.BeFTdata = os.path.join('inductionData', 'Be1xyzFTdata.mat')
         self.FTdata = os.path.join(self.inductPath, 'Bi1xyzFTdata.mat')
         self.asymFile = self.fNameInduct + '_asymDevs.mat'
@@ -645,10 +647,13 @@ class InductOgramParamsStruct:
         self.Dmin = None
         self.Dmax = None
         self.zbFixed_km = None
-        self.EckhardtSolveMethod = 'RK45'  # Numerical solution method for scipy.integrate.solve_ivp. See https://docs.scipy.org/doc/scipy/reference/generated/scipy.integrate.solve_ivp.html
+        self.EckhardtSolveMethod = 'dop853'  # Numerical solution method. Lowercase integrator names for scipy.integrate.ode ('dop853', 'dopri5', 'lsoda', 'vode', 'zvode') are fastest; other options are passed to scipy.integrate.solve_ivp. See https://docs.scipy.org/doc/scipy/reference/generated/scipy.integrate.ode.html and https://docs.scipy.org/doc/scipy/reference/generated/scipy.integrate.solve_ivp.html
         self.rMinODE = 1e3  # Minimum radius to use for numerical solution. Cannot be zero because of singularity at the origin.
         self.oceanInterpMethod = 'linear'  # Interpolation method for determining ocean conductivities when REDUCED_INDUCT is True.
         self.nIntL = 5  # Number of ocean layers to use when REDUCED_INDUCT = 1
+        self.SAVE_NPZ = False  # Whether to save induced moments as uncompressed .npz files instead of .mat, for faster disk access in large sweeps. .mat files can also be read in Matlab.
+        self.BinmDtype = np.complex64  # Data type for storing induced moments Binm_nT and BinmLin_nT. complex64 halves memory use in large sweeps; set to np.complex_ for full double precision. Response amplitudes Aen are always double precision.
+        self.asymShapeDtype = np.complex64  # Data type for asymmetric and gravity shape coefficients asymShape_m and gravShape_m. complex64 halves memory use; set to np.complex_ for full double precision, e.g. for validation.
 
         # Plot settings to mark on inductograms after Vance et al. (2021): https://doi.org/10.1029/2020JE006418
         self.V2021_zb_km = {
@@ -741,7 +746,7 @@ class ExcitationSpectrumParamsStruct:
     # Do not set any values below. All values are assigned in PlanetProfile.GetConfig.
     def __init__(self):
         self.nOmegaPts = 100  # Resolution in log frequency space for magnetic excitation spectra
-        self.interpMethod = 'cubic'  # Interpolation method for complex response amplitudes in Fourier spectrum
+        self.interpMethod = 'cubic'  # Interpolation method for complex response amplitudes in Fourier spectrum. Options are 'linear', 'cubic', 'pchip', or any other kind accepted by scipy.interpolate.interp1d.
         self.Tmin_hr = None  # Cutoff period in hr to limit Fourier space plots to
 
 
@@ -1675,6 +1680,15 @@ class EOSlistStruct:
 
 """ Physical constants """
 class ConstantsStruct:
+    # Constants are only ever read, so fix the attribute layout to avoid a per-instance dict
+    __slots__ = ('G', 'bar2GPa', 'bar2MPa', 'erg2J', 'T0', 'P0', 'R', 'mu0', 'Pmin_MPa', 'stdSeawater_ppt',
+                 'sigmaH2O_Sm', 'mMgSO4_gmol', 'mNaCl_gmol', 'mNH3_gmol', 'mH2O_gmol', 'mCH4_gmol', 'mCO2_gmol',
+                 'mFe_gmol', 'mFeS_gmol', 'mClathGas_gmol', 'clathGasFrac_ppt', 'QScore', 'kThermWater_WmK',
+                 'kThermSil_WmK', 'kThermFe_WmK', 'phaseClath', 'phaseSil', 'phaseFe', 'phaseFeSolid', 'phaseFeS',
+                 'phaseFeSsolid', 'sigmaClath_Sm', 'sigmaCO2Clath_Sm', 'EactCO2Clath_kJmol', 'Eact_kJmol',
+                 'etaMelt_Pas', 'PminHPices_MPa', 'PmaxLiquid_MPa', 'sigmaDef_Sm', 'sigmaMin_Sm', 'wFeDef_ppt',
+                 'ionosTopDefault_km', 'sigmaIonosPedersenDefault_Sm')
+
     def __init__(self):
         """ General physical constants """
         self.G = 6.673e-11  # "Big G" gravitational constant, m^3/kg/s